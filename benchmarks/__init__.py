@@ -0,0 +1 @@
+"""Benchmarks for the Message log integration."""
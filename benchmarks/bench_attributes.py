@@ -0,0 +1,99 @@
+"""State attributes benchmark.
+
+Measures building the message_list state attribute of the last message
+sensor for logs of 1k, 10k and 100k messages: building it for every message
+and slicing, as before, building it for the first items only, and the
+cached call done on every state write while the list is unchanged.
+
+Run from the repository root: python -m benchmarks.bench_attributes
+"""
+
+from timeit import timeit
+
+from custom_components.message_log.message_log_settings import (
+    MessageItem,
+    MessageItemAttr,
+    MessageList,
+)
+
+SIZES: list[int] = [1_000, 10_000, 100_000]
+ATTR_COUNT: int = 10
+REPEAT: int = 20
+
+
+# ------------------------------------------------------------------
+def create_message_list(count: int) -> MessageList:
+    """Create a message list with count messages."""
+
+    levels: list[str] = ["Info", "Attention", "Warning", "Error"]
+
+    return MessageList(
+        MessageItem(
+            f"Message number {index} from the benchmark",
+            levels[index % len(levels)],
+            source="Benchmark",
+        )
+        for index in range(count)
+    )
+
+
+# ------------------------------------------------------------------
+def build_all_attr(message_list: MessageList, count: int) -> list[MessageItemAttr]:
+    """Build attributes for every message and slice, as done before."""
+
+    return [
+        MessageItemAttr(
+            item.message,
+            item.message_level,
+            item.icon,
+            item.notify,
+            item.added_at,
+            count=item.count,
+        )
+        for item in message_list
+    ][:count]
+
+
+# ------------------------------------------------------------------
+def bench(count: int) -> tuple[float, float, float]:
+    """Return seconds per call for all, first items only and cached."""
+
+    message_list: MessageList = create_message_list(count)
+
+    all_time: float = (
+        timeit(lambda: build_all_attr(message_list, ATTR_COUNT), number=REPEAT) / REPEAT
+    )
+
+    def uncached() -> None:
+        message_list.version += 1
+        message_list.to_attr(ATTR_COUNT)
+
+    first_time: float = timeit(uncached, number=REPEAT) / REPEAT
+
+    cached_time: float = (
+        timeit(lambda: message_list.to_attr(ATTR_COUNT), number=REPEAT * 100)
+        / REPEAT
+        / 100
+    )
+
+    assert len(message_list.to_attr(ATTR_COUNT)) == ATTR_COUNT
+
+    return all_time, first_time, cached_time
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run benchmark."""
+
+    print(f"{'messages':>10} {'all ms':>10} {'first N ms':>11} {'cached us':>10}")
+
+    for count in SIZES:
+        all_time, first_time, cached_time = bench(count)
+        print(
+            f"{count:>10} {all_time * 1000:>10.2f} {first_time * 1000:>11.3f}"
+            f" {cached_time * 1_000_000:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
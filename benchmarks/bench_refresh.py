@@ -0,0 +1,144 @@
+"""Refresh benchmark.
+
+Drives ComponentApi.async_update, ComponentApi.async_add_message and
+MessageLastSensor.extra_state_attributes against the stand-in hass in
+fake_hass for logs of 10, 1k, 10k and 100k messages. Reports wall time per
+call, the time to write the pending adds to storage, the peak memory
+allocated by one add, refresh and attributes cycle, and the bytes in storage
+after the adds have been written.
+
+The adds are timed within the write delay, so they do not include the
+write. The write is timed on its own: a snapshot rewrite of the whole log,
+or a journal append.
+
+Run from the repository root: python -m benchmarks.bench_refresh
+"""
+
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import tracemalloc
+from types import SimpleNamespace
+
+from custom_components.message_log.component_api import ComponentApi
+from custom_components.message_log.const import (
+    CONF_MAX_MESSAGES,
+    CONF_USE_JOURNAL,
+    CONF_WRITE_DELAY_SECONDS,
+    STORAGE_KEY,
+)
+from custom_components.message_log.message_log_settings import MessageItem
+from custom_components.message_log.sensor import MessageLastSensor
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .bench_startup import write_storage
+from .fake_hass import FakeCoordinator, FakeHass, create_entry
+
+SIZES: list[int] = [10, 1_000, 10_000, 100_000]
+REPEAT: int = 20
+
+
+# ------------------------------------------------------------------
+def storage_bytes(config_dir: str) -> int:
+    """Bytes in the message log storage files."""
+
+    return sum(
+        path.stat().st_size
+        for path in Path(config_dir, STORAGE_DIR).glob(STORAGE_KEY + "*")
+        if path.is_file()
+    )
+
+
+# ------------------------------------------------------------------
+async def bench(count: int, use_journal: bool) -> dict[str, float]:
+    """Return seconds per call and write, peak bytes allocated and storage bytes."""
+
+    with TemporaryDirectory() as config_dir:
+        write_storage(config_dir, count)
+
+        hass = FakeHass(config_dir)
+        coordinator = FakeCoordinator()
+        entry = create_entry(
+            {
+                CONF_MAX_MESSAGES: 0,
+                CONF_USE_JOURNAL: use_journal,
+                CONF_WRITE_DELAY_SECONDS: 2,
+            }
+        )
+        component_api = ComponentApi(hass, coordinator, entry)
+        entry.runtime_data = SimpleNamespace(
+            coordinator=coordinator, component_api=component_api
+        )
+        sensor = MessageLastSensor(hass, entry)
+
+        await component_api.settings.async_read_head()
+        await component_api.async_load_message_list()
+
+        start: float = perf_counter()
+        for _ in range(REPEAT):
+            await component_api.async_update()
+        update_time: float = (perf_counter() - start) / REPEAT
+
+        add_time: float = 0
+        attr_time: float = 0
+
+        for index in range(REPEAT):
+            message_item = MessageItem(f"Added message {index}", "Warning")
+
+            start = perf_counter()
+            await component_api.async_add_message(message_item)
+            add_time += perf_counter() - start
+
+            start = perf_counter()
+            attr: dict = sensor.extra_state_attributes
+            attr_time += perf_counter() - start
+
+        assert attr["message_list"][0].message == message_item.message
+        assert len(component_api.settings.message_list) == count + REPEAT
+
+        tracemalloc.start()
+        await component_api.async_add_message(MessageItem("Traced message", "Error"))
+        sensor.extra_state_attributes  # noqa: B018
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = perf_counter()
+        await component_api.settings.async_flush_settings()
+        await hass.async_block_till_done()
+        write_time: float = perf_counter() - start
+        component_api.cancel_expiry()
+
+        return {
+            "update": update_time,
+            "add": add_time / REPEAT,
+            "attr": attr_time / REPEAT,
+            "write": write_time,
+            "peak": peak,
+            "storage": storage_bytes(config_dir),
+        }
+
+
+# ------------------------------------------------------------------
+async def async_main() -> None:
+    """Run benchmark."""
+
+    for use_journal in (False, True):
+        print("journal" if use_journal else "snapshot")
+        print(
+            f"{'messages':>10} {'update ms':>10} {'add ms':>10} {'attr ms':>10}"
+            f" {'write ms':>10} {'peak kB':>9} {'storage kB':>11}"
+        )
+
+        for count in SIZES:
+            result: dict[str, float] = await bench(count, use_journal)
+            print(
+                f"{count:>10} {result['update'] * 1000:>10.3f}"
+                f" {result['add'] * 1000:>10.3f} {result['attr'] * 1000:>10.3f}"
+                f" {result['write'] * 1000:>10.1f}"
+                f" {result['peak'] / 1024:>9.1f} {result['storage'] / 1024:>11.0f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
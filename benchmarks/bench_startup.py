@@ -0,0 +1,145 @@
+"""Startup benchmark.
+
+Drives MessageLogSettings.async_read_head and
+MessageLogSettings.async_read_settings against the stand-in hass in
+fake_hass for a stored message log of 1k, 10k and 100k messages with a
+journal of JOURNAL_RECORDS adds. Reports the time until the newest message
+is available and the time for the full load, including the journal replay,
+the merge of the newest message and the trim.
+
+Run from the repository root: python -m benchmarks.bench_startup
+"""
+
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import orjson
+
+from custom_components.message_log.const import (
+    STORAGE_KEY,
+    STORAGE_KEY_VIEW,
+    STORAGE_VERSION,
+)
+from custom_components.message_log.hass_util import StorageJournal
+from custom_components.message_log.message_log_settings import (
+    MessageItem,
+    MessageLogSettings,
+)
+
+from .fake_hass import FakeHass
+
+SIZES: list[int] = [1_000, 10_000, 100_000]
+JOURNAL_RECORDS: int = 200
+
+
+# ------------------------------------------------------------------
+def write_storage(config_dir: str, count: int) -> None:
+    """Write a message log store and view store with count messages."""
+
+    levels: list[str] = ["Info", "Attention", "Warning", "Error"]
+    rows: list[list] = [
+        MessageItem(
+            f"Message number {index} from the benchmark",
+            levels[index % len(levels)],
+            source="Benchmark",
+        ).to_row()
+        for index in range(count)
+    ]
+
+    storage_dir: Path = Path(config_dir, ".storage")
+    storage_dir.mkdir(parents=True, exist_ok=True)
+
+    (storage_dir / STORAGE_KEY).write_bytes(
+        orjson.dumps(
+            {
+                "version": STORAGE_VERSION,
+                "minor_version": 1,
+                "key": STORAGE_KEY,
+                "data": {STORAGE_KEY: {"message_list": rows}},
+            }
+        )
+    )
+    (storage_dir / STORAGE_KEY_VIEW).write_bytes(
+        orjson.dumps(
+            {
+                "version": 1,
+                "minor_version": 1,
+                "key": STORAGE_KEY_VIEW,
+                "data": {
+                    "message_list_show": 100,
+                    "message_list_orderby": 20,
+                    "highest_message_level": 40,
+                    "head": rows[0],
+                },
+            }
+        )
+    )
+
+
+# ------------------------------------------------------------------
+def write_journal(settings: MessageLogSettings, count: int) -> None:
+    """Write a journal with count added messages."""
+
+    journal: StorageJournal = settings.journal___
+    journal.path.write_bytes(
+        b"".join(
+            orjson.dumps(
+                {
+                    "op": "add",
+                    "item": settings.encode_data(
+                        MessageItem(f"Journal message {index}", source="Benchmark")
+                    ),
+                }
+            )
+            + b"\n"
+            for index in range(count)
+        )
+    )
+
+
+# ------------------------------------------------------------------
+async def bench(count: int) -> tuple[float, float, int]:
+    """Return seconds to newest message, seconds to full load and file size."""
+
+    with TemporaryDirectory() as config_dir:
+        write_storage(config_dir, count)
+        hass = FakeHass(config_dir)
+        settings = MessageLogSettings(hass, use_journal=True)
+        write_journal(settings, JOURNAL_RECORDS)
+        size: int = Path(config_dir, ".storage", STORAGE_KEY).stat().st_size
+
+        start: float = perf_counter()
+        await settings.async_read_head()
+        head_time: float = perf_counter() - start
+
+        assert len(settings.message_list) == 1
+
+        start = perf_counter()
+        await settings.async_read_settings()
+        load_time: float = perf_counter() - start
+        await hass.async_block_till_done()
+
+        assert settings.loaded
+        assert len(settings.message_list) == count + JOURNAL_RECORDS
+
+        return head_time, load_time, size
+
+
+# ------------------------------------------------------------------
+async def async_main() -> None:
+    """Run benchmark."""
+
+    print(f"{'messages':>10} {'newest ms':>10} {'full load ms':>13} {'file kB':>9}")
+
+    for count in SIZES:
+        head_time, load_time, size = await bench(count)
+        print(
+            f"{count:>10} {head_time * 1000:>10.2f} {load_time * 1000:>13.1f}"
+            f" {size / 1024:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
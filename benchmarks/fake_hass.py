@@ -0,0 +1,169 @@
+"""Stand-in for HomeAssistant.
+
+Implements only what the Message log integration and the helpers it uses
+(Store, event tracking and translations) need, so the benchmarks run
+without setting up Home Assistant.
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from inspect import iscoroutine
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.message_log.const import DOMAIN
+from homeassistant import core as ha_core
+from homeassistant.core import CoreState, HassJob
+from homeassistant.util.async_ import create_eager_task
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class FakeBus:
+    """Event bus that counts fired events."""
+
+    def __init__(self) -> None:
+        """Init."""
+        self.fired: int = 0
+
+    # ------------------------------------------------------------------
+    def async_fire(self, event_type: str, event_data: dict | None = None) -> None:
+        """Fire event."""
+        self.fired += 1
+
+    # ------------------------------------------------------------------
+    def async_listen(self, event_type: str, listener: Callable, **kwargs) -> Callable:
+        """Listen, events are never delivered."""
+        return lambda: None
+
+    # ------------------------------------------------------------------
+    def async_listen_once(self, event_type: str, listener: Callable) -> Callable:
+        """Listen once, events are never delivered."""
+        return lambda: None
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class FakeHass:
+    """Stand-in for HomeAssistant."""
+
+    def __init__(self, config_dir: str) -> None:
+        """Init, must be called in the event loop."""
+
+        self.loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self.state: CoreState = CoreState.running
+        self.data: dict[str, Any] = {}
+        self.bus: FakeBus = FakeBus()
+        self.services = SimpleNamespace(async_register=lambda *args, **kwargs: None)
+        self.auth = SimpleNamespace(async_get_owner=self.async_get_owner)
+        self.config = SimpleNamespace(
+            config_dir=config_dir,
+            path=lambda *args: str(Path(config_dir, *args)),
+            language="en",
+            components={DOMAIN},
+        )
+        self.tasks: set[asyncio.Task] = set()
+
+        # Used by async_get_hass
+        ha_core._hass.hass = self  # noqa: SLF001
+
+    # ------------------------------------------------------------------
+    async def async_get_owner(self) -> None:
+        """No owner, the configured language is used."""
+        return None
+
+    # ------------------------------------------------------------------
+    def async_add_executor_job(self, target: Callable, *args) -> asyncio.Future:
+        """Run target in the executor."""
+        return self.loop.run_in_executor(None, target, *args)
+
+    # ------------------------------------------------------------------
+    def async_create_task(
+        self,
+        target: Coroutine,
+        name: str | None = None,
+        eager_start: bool = False,
+        **kwargs,
+    ) -> asyncio.Task:
+        """Create a task that is awaited by async_block_till_done."""
+
+        task: asyncio.Task = (
+            create_eager_task(target, name=name, loop=self.loop)
+            if eager_start
+            else self.loop.create_task(target, name=name)
+        )
+
+        if not task.done():
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+        return task
+
+    async_create_task_internal = async_create_task
+    async_create_background_task = async_create_task
+
+    # ------------------------------------------------------------------
+    def async_run_hass_job(self, hassjob: HassJob, *args, **kwargs) -> Any:
+        """Run a job from the event helpers."""
+
+        result: Any = hassjob.target(*args)
+
+        if iscoroutine(result):
+            return self.async_create_task(result)
+
+        return result
+
+    # ------------------------------------------------------------------
+    async def async_block_till_done(self) -> None:
+        """Wait for the created tasks."""
+
+        while len(self.tasks) > 0:
+            await asyncio.gather(*self.tasks)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class FakeCoordinator:
+    """Stand-in for DataUpdateCoordinator."""
+
+    def __init__(self) -> None:
+        """Init."""
+
+        self.update_interval: Any = None
+        self.update_method: Callable | None = None
+        self.last_update_success: bool = True
+
+    # ------------------------------------------------------------------
+    async def async_refresh(self) -> None:
+        """Refresh."""
+
+        if self.update_method is not None:
+            await self.update_method()
+
+    # ------------------------------------------------------------------
+    async def async_request_refresh(self) -> None:
+        """Refresh."""
+        await self.async_refresh()
+
+    # ------------------------------------------------------------------
+    def async_update_listeners(self) -> None:
+        """No listeners."""
+
+    # ------------------------------------------------------------------
+    def async_add_listener(self, update_callback: Callable, *args) -> Callable:
+        """No listeners."""
+        return lambda: None
+
+
+# ------------------------------------------------------------------
+def create_entry(options: dict[str, Any]) -> SimpleNamespace:
+    """Create a stand-in config entry with the options."""
+
+    entry = SimpleNamespace(
+        entry_id="benchmark",
+        options=options,
+        unload_callbacks=[],
+    )
+    entry.async_on_unload = entry.unload_callbacks.append
+    return entry
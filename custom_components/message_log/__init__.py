@@ -7,10 +7,12 @@ from dataclasses import dataclass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .component_api import ComponentApi
-from .const import DOMAIN, LOGGER
+from .const import CONF_REFRESH_COOLDOWN_SECONDS, DOMAIN, LOGGER
+from .hass_util import release_user_language_cache
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.NOTIFY]
 
@@ -37,6 +39,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bo
         hass,
         LOGGER,
         name=DOMAIN,
+        request_refresh_debouncer=Debouncer(
+            hass,
+            LOGGER,
+            cooldown=entry.options.get(CONF_REFRESH_COOLDOWN_SECONDS, 1),
+            immediate=False,
+        ),
     )
 
     component_api: ComponentApi = ComponentApi(
@@ -52,15 +60,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bo
 
     entry.async_on_unload(entry.add_update_listener(config_update_listener))
 
+    await component_api.settings.async_read_head()
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     await coordinator.async_config_entry_first_refresh()
 
+    entry.async_create_background_task(
+        hass,
+        component_api.async_load_message_list(),
+        DOMAIN + " load message list",
+    )
+
     return True
 
 
 # ------------------------------------------------------------------
 async def async_unload_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bool:
     """Unload a config entry."""
+    await entry.runtime_data.component_api.settings.async_flush_settings()
+    release_user_language_cache(hass)
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
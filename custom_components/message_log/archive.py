@@ -0,0 +1,190 @@
+"""Message archive.
+
+External imports: orjson
+"""
+
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, datetime
+import gzip
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import STORAGE_KEY
+from .message_log_settings import MessageItem, MessageLevel
+
+ARCHIVE_ACTIVE_SEGMENT = "active.jsonl"
+ARCHIVE_SEGMENT_SIZE = 512 * 1024
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class MessageArchive:
+    """Archive of removed messages.
+
+    Rows are appended to an active segment file. When it reaches
+    ARCHIVE_SEGMENT_SIZE it is compressed into a segment-<time>.jsonl.gz file
+    and only the newest max_segments compressed segments are kept.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_segments: int = 10) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.path: Path = Path(hass.config.path(STORAGE_DIR, STORAGE_KEY + "_archive"))
+        self.max_segments: int = max_segments
+        self.lock: asyncio.Lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    async def async_archive(self, items: list[MessageItem]) -> None:
+        """Archive messages."""
+
+        if len(items) == 0:
+            return
+
+        data: bytes = b"".join(orjson.dumps(item.to_row()) + b"\n" for item in items)
+
+        async with self.lock:
+            await self.hass.async_add_executor_job(self.append, data)
+
+    # ------------------------------------------------------------------
+    def append(self, data: bytes) -> None:
+        """Append data to the active segment and rotate it when full."""
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        active: Path = self.path / ARCHIVE_ACTIVE_SEGMENT
+
+        with active.open("ab") as active_file:
+            active_file.write(data)
+
+        if active.stat().st_size >= ARCHIVE_SEGMENT_SIZE:
+            self.rotate()
+
+    # ------------------------------------------------------------------
+    def rotate(self) -> None:
+        """Compress the active segment and remove the oldest segments."""
+
+        active: Path = self.path / ARCHIVE_ACTIVE_SEGMENT
+        segment: Path = self.path / (
+            "segment-" + datetime.now(UTC).strftime("%Y%m%d%H%M%S%f") + ".jsonl.gz"
+        )
+
+        with gzip.open(segment, "wb") as segment_file:
+            segment_file.write(active.read_bytes())
+
+        active.unlink()
+
+        for old_segment in self.segments()[self.max_segments :]:
+            old_segment.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    def segments(self) -> list[Path]:
+        """Compressed segments, newest first."""
+        return sorted(self.path.glob("segment-*.jsonl.gz"), reverse=True)
+
+    # ------------------------------------------------------------------
+    async def async_query(
+        self,
+        text: str = "",
+        message_level: MessageLevel | None = None,
+        source: str = "",
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Query archived messages, newest first.
+
+        Holds the lock, so segments are not rotated or removed while read.
+        """
+
+        async with self.lock:
+            return await self.hass.async_add_executor_job(
+                self.query, text, message_level, source, since, until, limit
+            )
+
+    # ------------------------------------------------------------------
+    def query(
+        self,
+        text: str = "",
+        message_level: MessageLevel | None = None,
+        source: str = "",
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Query archived messages, newest first."""
+
+        text = text.lower()
+        source = source.lower()
+        since_ts: float = since.timestamp() if since is not None else 0
+        until_ts: float = until.timestamp() if until is not None else float("inf")
+        result: list[dict[str, Any]] = []
+
+        for data in self.read_segments():
+            for line in reversed(data.splitlines()):
+                try:
+                    item: MessageItem = MessageItem.from_row(orjson.loads(line))
+                except (orjson.JSONDecodeError, IndexError, ValueError):
+                    continue
+
+                if (
+                    (text == "" or text in item.message.lower())
+                    and (message_level is None or item.message_level == message_level)
+                    and (source == "" or source == item.source.lower())
+                    and since_ts <= item.added_at_ts <= until_ts
+                ):
+                    result.append(
+                        {
+                            "message": item.message,
+                            "message_level": item.message_level.name.capitalize(),
+                            "icon": item.icon,
+                            "source": item.source,
+                            "added_at": item.added_at.isoformat(),
+                            "count": item.count,
+                        }
+                    )
+
+                    if len(result) >= limit:
+                        return result
+
+        return result
+
+    # ------------------------------------------------------------------
+    def read_segments(self) -> Iterator[bytes]:
+        """Read the active segment and then the compressed ones, newest first."""
+
+        active: Path = self.path / ARCHIVE_ACTIVE_SEGMENT
+
+        if active.is_file():
+            yield active.read_bytes()
+
+        if not self.path.is_dir():
+            return
+
+        for segment in self.segments():
+            with gzip.open(segment, "rb") as segment_file:
+                yield segment_file.read()
+
+    # ------------------------------------------------------------------
+    async def async_remove(self) -> None:
+        """Remove the archive."""
+
+        async with self.lock:
+            await self.hass.async_add_executor_job(self.remove)
+
+    # ------------------------------------------------------------------
+    def remove(self) -> None:
+        """Remove the archive."""
+
+        if not self.path.is_dir():
+            return
+
+        for archive_file in self.path.iterdir():
+            archive_file.unlink(missing_ok=True)
+
+        self.path.rmdir()
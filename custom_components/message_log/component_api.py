@@ -1,27 +1,57 @@
 """Component api."""
 
+import asyncio
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
-from babel.dates import format_timedelta
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .archive import MessageArchive
 from .const import (
+    CONF_ARCHIVE_MAX_SEGMENTS,
+    CONF_ARCHIVE_REMOVED_MESSAGES,
+    CONF_DEDUP_WINDOW_MINUTES,
+    CONF_INGEST_WINDOW_MILLISECONDS,
+    CONF_MARKDOWN_ITEM_TEMPLATE,
+    CONF_MARKDOWN_LAYOUT,
     CONF_MARKDOWN_MESSAGE_LIST_COUNT,
+    CONF_MAX_MESSAGES,
+    CONF_MAX_STORED_KILOBYTES,
     CONF_ORDER_BY_MESSAGE_LEVEL,
+    CONF_OVERFLOW_POLICY,
+    CONF_OVERFLOW_SAMPLE_RATE,
+    CONF_RATE_LIMIT_PER_SOURCE,
+    CONF_RATE_LIMIT_TOTAL,
+    CONF_REFRESH_COOLDOWN_SECONDS,
     CONF_REMOVE_MESSAGE_AFTER_HOURS,
     CONF_SCROLL_MESSAGES_EVERY_MINUTES,
     CONF_SCROLL_THROUGH_LAST_MESSAGES_COUNT,
+    CONF_USE_JOURNAL,
+    CONF_WRITE_DELAY_SECONDS,
     DOMAIN,
     EVENT_NEW_LOG_ENTRY,
     EVENT_NEW_NOTIFY_LOG_ENTRY,
+    OVERFLOW_POLICY_DROP_INCOMING,
+    OVERFLOW_POLICY_DROP_OLDEST_INFO,
+    OVERFLOW_POLICY_SAMPLE_INFO,
     SOURCE_SERVICE,
     TRANSLATE_EXTRA,
 )
-from .hass_util import Translate, async_hass_add_executor_job
+from .hass_util import RelativeTime, Translate, async_get_user_language
+from .markdown import MARKDOWN_LAYOUT_DEFAULT, MarkdownFragments, MarkdownLayout
 from .message_log_settings import (
     MessageItem,
     MessageLevel,
@@ -29,6 +59,25 @@ from .message_log_settings import (
     MessageListShow,
     MessageLogSettings,
 )
+from .rate_limit import RateLimiter
+
+ADD_MESSAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required("message"): cv.string,
+        vol.Optional("message_level"): vol.All(
+            cv.string, vol.Upper, vol.In([level.name for level in MessageLevel])
+        ),
+        vol.Optional("icon"): cv.icon,
+        vol.Optional("remove_after"): vol.Coerce(float),
+        vol.Optional("notify"): cv.boolean,
+        vol.Optional("added_at"): vol.All(cv.string, vol.Datetime("%Y-%m-%d %H:%M:%S")),
+        vol.Optional("source"): cv.string,
+        vol.Optional("dedup_key"): cv.string,
+    }
+)
+ADD_BATCH_SCHEMA = vol.Schema(
+    {vol.Required("messages"): vol.All(cv.ensure_list, [ADD_MESSAGE_SCHEMA])}
+)
 
 
 # ------------------------------------------------------------------
@@ -60,57 +109,76 @@ class Translations:
         self.error_str: str
 
         self.translate: Translate = Translate(hass, TRANSLATE_EXTRA)
+        self.language: str = ""
 
     # ------------------------------------------------------------------
     async def async_refresh(self):
-        """Refresh."""
+        """Refresh when the user language has changed."""
+
+        language: str = await async_get_user_language()
+
+        if language == self.language:
+            return
+
         self.now_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".rt_now",
+            language=language,
         )
 
         self.for_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".rt_for",
+            language=language,
         )
 
         self.ago_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".rt_ago",
+            language=language,
         )
 
         self.message_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".message",
-        )
-        self.messages_str = await self.translate.async_get_localized_str(
-            TRANSLATE_EXTRA + ".message",
+            language=language,
         )
         self.messages_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".messages",
+            language=language,
         )
         self.last_message_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".last_message",
+            language=language,
         )
 
         self.received_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".received",
+            language=language,
         )
         self.relevance_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".relevance",
+            language=language,
         )
         self.all_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".all",
+            language=language,
         )
         self.info_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".info",
+            language=language,
         )
         self.attention_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".attention",
+            language=language,
         )
         self.warning_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".warning",
+            language=language,
         )
         self.error_str = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".error",
+            language=language,
         )
 
+        self.language = language
+
 
 # ------------------------------------------------------------------
 # ------------------------------------------------------------------
@@ -134,19 +202,48 @@ class ComponentApi:
         self.markdown: str = ""
         self.markdown_message_list: str = ""
         self.markdown_message_settings: str = ""
+        self.markdown_message_list_received: list[str] = []
+        self.markdown_fragments: MarkdownFragments = MarkdownFragments()
+        self.markdown_layout: MarkdownLayout = MarkdownLayout(
+            self.entry.options.get(CONF_MARKDOWN_LAYOUT, MARKDOWN_LAYOUT_DEFAULT),
+            self.entry.options.get(CONF_MARKDOWN_ITEM_TEMPLATE, ""),
+        )
+        self.markdown_message_settings_key: tuple[str, str] | None = None
         self.message_list_sorted: list[MessageItem] = []
+        self.ingest_queue: list[tuple[MessageItem, asyncio.Future[None]]] = []
+        self.ingest_task: asyncio.Task | None = None
+        self.overflow_dropped_count: int = 0
+        self.overflow_sample_count: int = 0
+        self.unsub_expiry: CALLBACK_TYPE | None = None
+        self.expiry_scheduled_at: datetime | None = None
 
         self.settings: MessageLogSettings = MessageLogSettings(
-            hass, self.entry.options.get(CONF_ORDER_BY_MESSAGE_LEVEL, True)
+            hass,
+            self.entry.options.get(CONF_ORDER_BY_MESSAGE_LEVEL, True),
+            self.entry.options.get(CONF_USE_JOURNAL, False),
+            self.entry.options.get(CONF_WRITE_DELAY_SECONDS, 2),
+            int(self.entry.options.get(CONF_MAX_MESSAGES, 0)),
+            int(self.entry.options.get(CONF_MAX_STORED_KILOBYTES, 0) * 1024),
+        )
+
+        self.rate_limiter: RateLimiter = RateLimiter(
+            self.entry.options.get(CONF_RATE_LIMIT_PER_SOURCE, 0),
+            self.entry.options.get(CONF_RATE_LIMIT_TOTAL, 0),
+        )
+
+        self.archive: MessageArchive = MessageArchive(
+            hass, int(self.entry.options.get(CONF_ARCHIVE_MAX_SEGMENTS, 10))
         )
 
         self.coordinator.update_interval = timedelta(
             minutes=entry.options.get(CONF_SCROLL_MESSAGES_EVERY_MINUTES, 1)
         )
         self.coordinator.update_method = self.async_update
+        entry.async_on_unload(self.cancel_expiry)
 
         self.translate: Translate = Translate(hass, TRANSLATE_EXTRA)
         self.translations: Translations = Translations(hass)
+        self.relative_time: RelativeTime = RelativeTime(hass)
 
         """Set up the actions for the Message log integration."""
         hass.services.async_register(
@@ -154,6 +251,12 @@ class ComponentApi:
             "add",
             self.async_add_message_service,
         )
+        hass.services.async_register(
+            DOMAIN,
+            "add_batch",
+            self.async_add_batch_service,
+            schema=ADD_BATCH_SCHEMA,
+        )
         hass.services.async_register(
             DOMAIN,
             "remove",
@@ -169,49 +272,114 @@ class ComponentApi:
             "show",
             self.async_messagelist_show_service,
         )
+        hass.services.async_register(
+            DOMAIN,
+            "query_archive",
+            self.async_query_archive_service,
+            supports_response=SupportsResponse.ONLY,
+        )
 
     # ------------------------------------------------------------------
-    async def async_relative_time_received(self, date_time: datetime) -> str:
-        """Relative time received."""
+    def relative_time_received(self, items: list[MessageItem]) -> list[str]:
+        """Relative time received for items, formatted in one batch."""
 
-        return (
-            self.translations.received_str + " " + await self.relative_time(date_time)
-        )
+        return [
+            self.translations.received_str + " " + relative_time
+            for relative_time in self.relative_time.format_batch(
+                item.added_at_ts for item in items
+            )
+        ]
 
     # ------------------------------------------------------------------
-    @async_hass_add_executor_job()
-    def relative_time(self, date_time: datetime) -> str:
-        """Relative time."""
+    async def async_load_message_list(self) -> None:
+        """Load the full message list and refresh.
 
-        diff: timedelta = date_time - datetime.now(UTC)
+        Messages evicted because the limits were lowered are archived.
+        """
 
-        return format_timedelta(
-            diff, add_direction=True, locale=self.translate.acive_language
-        )
+        await self.async_archive(await self.settings.async_read_settings())
+        self.schedule_expiry()
+        await self.coordinator.async_refresh()
+
+    # ------------------------------------------------------------------
+    async def async_request_refresh(self, immediate: bool = False) -> None:
+        """Refresh after the refresh cooldown, bursts share one refresh.
+
+        Refreshes at once when immediate or without a cooldown.
+        """
+
+        if immediate or self.entry.options.get(CONF_REFRESH_COOLDOWN_SECONDS, 1) <= 0:
+            await self.coordinator.async_refresh()
+        else:
+            await self.coordinator.async_request_refresh()
 
     # ------------------------------------------------------------------
     async def async_remove_messages_service(self, call: ServiceCall) -> None:
         """Remove nessage service."""
+        await self.settings.async_wait_loaded()
+
+        removed_items: list[MessageItem]
+
         if "message_level" in call.data:
             tmp_message_level: MessageLevel = MessageLevel[
                 call.data.get("message_level", "INFO").upper()
             ]
 
-            for index, item in reversed(list(enumerate(self.settings.message_list))):
-                if item.message_level == tmp_message_level:
-                    del self.settings.message_list[index]
+            removed_items = self.settings.message_list.remove_level(tmp_message_level)
         else:
-            self.settings.message_list.clear()
+            removed_items = self.settings.message_list.clear()
 
         self.settings.set_highest_message_level()
-        await self.settings.async_write_settings()
-        await self.coordinator.async_refresh()
+        await self.settings.async_write_removed(removed_items)
+        await self.async_archive(removed_items)
+        await self.async_request_refresh()
 
     # ------------------------------------------------------------------
-    async def async_add_message_service(self, call: ServiceCall) -> None:
-        """Message log add service."""
+    async def async_archive(self, items: list[MessageItem]) -> None:
+        """Archive removed messages when enabled."""
+
+        if self.entry.options.get(CONF_ARCHIVE_REMOVED_MESSAGES, False):
+            await self.archive.async_archive(items)
+
+    # ------------------------------------------------------------------
+    async def async_query_archive_service(self, call: ServiceCall) -> ServiceResponse:
+        """Query archive service."""
+
+        since: datetime | None = None
+        until: datetime | None = None
+
+        if "since" in call.data:
+            since = datetime.strptime(
+                call.data["since"],
+                "%Y-%m-%d %H:%M:%S",
+            ).astimezone(UTC)
+
+        if "until" in call.data:
+            until = datetime.strptime(
+                call.data["until"],
+                "%Y-%m-%d %H:%M:%S",
+            ).astimezone(UTC)
+
+        return {
+            "messages": await self.archive.async_query(
+                text=call.data.get("text", ""),
+                message_level=(
+                    MessageLevel[call.data["message_level"].upper()]
+                    if "message_level" in call.data
+                    else None
+                ),
+                source=call.data.get("source", ""),
+                since=since,
+                until=until,
+                limit=int(call.data.get("limit", 100)),
+            )
+        }
+
+    # ------------------------------------------------------------------
+    def create_message_item(self, data: dict) -> MessageItem:
+        """Create a message item from add service data."""
 
-        tmp_dict = call.data.copy()
+        tmp_dict = dict(data)
 
         if "remove_after" not in tmp_dict:
             tmp_dict["remove_after"] = self.entry.options.get(
@@ -228,50 +396,231 @@ class ComponentApi:
         if tmp_dict.get("source", "") == "":
             tmp_dict["source"] = SOURCE_SERVICE
 
-        await self.async_add_message(MessageItem(**tmp_dict))
+        return MessageItem(**tmp_dict)
+
+    # ------------------------------------------------------------------
+    async def async_add_message_service(self, call: ServiceCall) -> None:
+        """Message log add service."""
+
+        await self.async_add_message(self.create_message_item(call.data))
+
+    # ------------------------------------------------------------------
+    async def async_add_batch_service(self, call: ServiceCall) -> None:
+        """Message log add batch service."""
+
+        await self.async_add_messages(
+            [self.create_message_item(data) for data in call.data.get("messages", [])]
+        )
 
     # ------------------------------------------------------------------
     async def async_add_message(self, message_item: MessageItem) -> None:
-        """Message log add message."""
-        self.settings.message_list.insert(0, message_item)
-        self.settings.set_highest_message_level()
-        await self.settings.async_write_settings()
-        await self.async_fire_events(message_item)
-        await self.coordinator.async_refresh()
+        """Message log add message.
+
+        Returns when the message has been applied. A message arriving while
+        the queue is idle is applied at once, messages arriving while it is
+        busy are collected for the ingest window and applied together, each
+        still with its own events.
+        """
+
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self.ingest_queue.append((message_item, future))
+
+        if self.ingest_task is None or self.ingest_task.done():
+            self.ingest_task = self.hass.async_create_task(
+                self.async_ingest(), DOMAIN + " ingest", eager_start=True
+            )
+
+        await future
 
     # ------------------------------------------------------------------
-    async def async_fire_events(self, message_item: MessageItem) -> None:
-        """Fire events."""
+    async def async_ingest(self) -> None:
+        """Apply queued messages until the queue is empty."""
 
-        self.hass.bus.async_fire(
-            DOMAIN + "." + EVENT_NEW_LOG_ENTRY,
-            {
-                "message": message_item.message,
-                "message_level": message_item.message_level.name.capitalize(),
-            },
+        window: float = (
+            self.entry.options.get(CONF_INGEST_WINDOW_MILLISECONDS, 50) / 1000
+        )
+        busy: bool = False
+
+        while len(self.ingest_queue) > 0:
+            if busy and window > 0:
+                await asyncio.sleep(window)
+
+            busy = True
+            queued: list[tuple[MessageItem, asyncio.Future[None]]] = self.ingest_queue
+            self.ingest_queue = []
+
+            try:
+                await self.async_add_messages(
+                    [message_item for message_item, _future in queued],
+                    summarize_events=False,
+                )
+            except Exception as err:  # noqa: BLE001
+                for _message_item, future in queued:
+                    if not future.done():
+                        future.set_exception(err)
+            else:
+                for _message_item, future in queued:
+                    if not future.done():
+                        future.set_result(None)
+
+    # ------------------------------------------------------------------
+    async def async_add_messages(
+        self, message_items: list[MessageItem], summarize_events: bool = True
+    ) -> None:
+        """Add messages, oldest first, with one write and refresh.
+
+        Messages over the rate limits are dropped first. Repeats within the
+        dedup window are counted on the existing message, other messages are
+        subject to the overflow policy when the list is full. Events are
+        summarized into one burst, or fired per message when the messages
+        were added by separate callers.
+        """
+
+        message_items = self.rate_limiter.filter(message_items)
+
+        if len(message_items) == 0:
+            return
+
+        added_items: dict[str, MessageItem] = {}
+        repeated_items: dict[str, MessageItem] = {}
+
+        for message_item in message_items:
+            duplicate: MessageItem | None = self.find_repeat(message_item)
+
+            if duplicate is None:
+                if not self.overflow_allow(message_item):
+                    continue
+
+                self.settings.message_list.add(message_item)
+                added_items[message_item.uid] = message_item
+            else:
+                self.settings.message_list.repeat(duplicate, message_item)
+
+                if duplicate.uid not in added_items:
+                    repeated_items[duplicate.uid] = duplicate
+
+        if len(added_items) == 0 and len(repeated_items) == 0:
+            return
+
+        evicted_items: list[MessageItem] = self.settings.message_list.trim()
+
+        if len(added_items) > 0:
+            self.settings.set_highest_message_level()
+            self.settings.set_added_pending(list(added_items.values()))
+
+        if len(repeated_items) > 0:
+            self.settings.set_updated_pending(list(repeated_items.values()))
+
+        self.settings.set_removed_pending(evicted_items)
+        await self.settings.async_write_settings_delayed()
+        await self.async_archive(evicted_items)
+        self.schedule_expiry()
+        if summarize_events:
+            await self.async_fire_events(list(added_items.values()))
+        else:
+            for message_item in added_items.values():
+                await self.async_fire_events([message_item])
+        await self.async_request_refresh(
+            any(
+                message_item.message_level == MessageLevel.ERROR
+                for message_item in [*added_items.values(), *repeated_items.values()]
+            )
+        )
+
+    # ------------------------------------------------------------------
+    def overflow_allow(self, message_item: MessageItem) -> bool:
+        """Apply the overflow policy to a message about to be added.
+
+        While the list is full, drop_oldest_info adds the message and the
+        oldest message of the lowest level is evicted, drop_incoming drops
+        the message and sample_info keeps 1 in N info messages.
+        """
+
+        if not self.settings.message_list.full:
+            return True
+
+        policy: str = self.entry.options.get(
+            CONF_OVERFLOW_POLICY, OVERFLOW_POLICY_DROP_OLDEST_INFO
         )
+        allow: bool = True
+
+        if policy == OVERFLOW_POLICY_DROP_INCOMING:
+            allow = False
+        elif (
+            policy == OVERFLOW_POLICY_SAMPLE_INFO
+            and message_item.message_level == MessageLevel.INFO
+        ):
+            allow = (
+                self.overflow_sample_count
+                % int(self.entry.options.get(CONF_OVERFLOW_SAMPLE_RATE, 10))
+                == 0
+            )
+            self.overflow_sample_count += 1
+
+        if not allow:
+            self.overflow_dropped_count += 1
+
+        return allow
+
+    # ------------------------------------------------------------------
+    def find_repeat(self, message_item: MessageItem) -> MessageItem | None:
+        """Existing message the item repeats within the dedup window, if any."""
+
+        dedup_window: float = self.entry.options.get(CONF_DEDUP_WINDOW_MINUTES, 0)
+
+        if dedup_window <= 0:
+            return None
+
+        return self.settings.message_list.find_duplicate(
+            message_item, dedup_window * 60
+        )
+
+    # ------------------------------------------------------------------
+    async def async_fire_events(self, message_items: list[MessageItem]) -> None:
+        """Fire events, summarized when more than one message was added.
+
+        Each event carries the newest matching message and the count of
+        matching messages. No events are fired for repeats.
+        """
+
+        if len(message_items) == 0:
+            return
+
+        self.fire_event(EVENT_NEW_LOG_ENTRY, message_items)
+
+        for message_level in MessageLevel:
+            level_items: list[MessageItem] = [
+                message_item
+                for message_item in message_items
+                if message_item.message_level == message_level
+            ]
+
+            if len(level_items) > 0:
+                self.fire_event(
+                    EVENT_NEW_LOG_ENTRY + "_" + message_level.name.lower(),
+                    level_items,
+                )
+
+        notify_items: list[MessageItem] = [
+            message_item for message_item in message_items if message_item.notify
+        ]
+
+        if len(notify_items) > 0:
+            self.fire_event(EVENT_NEW_NOTIFY_LOG_ENTRY, notify_items)
+
+    # ------------------------------------------------------------------
+    def fire_event(self, event: str, message_items: list[MessageItem]) -> None:
+        """Fire event for the newest of message items."""
 
         self.hass.bus.async_fire(
-            DOMAIN
-            + "."
-            + EVENT_NEW_LOG_ENTRY
-            + "_"
-            + message_item.message_level.name.lower(),
+            DOMAIN + "." + event,
             {
-                "message": message_item.message,
-                "message_level": message_item.message_level.name.capitalize(),
+                "message": message_items[-1].message,
+                "message_level": message_items[-1].message_level.name.capitalize(),
+                "count": len(message_items),
             },
         )
 
-        if message_item.notify:
-            self.hass.bus.async_fire(
-                DOMAIN + "." + EVENT_NEW_NOTIFY_LOG_ENTRY,
-                {
-                    "message": message_item.message,
-                    "message_level": message_item.message_level.name.capitalize(),
-                },
-            )
-
     # ------------------------------------------------------------------
     async def async_messagelist_orderby_service(self, call: ServiceCall) -> None:
         """Message list orderby."""
@@ -288,8 +637,8 @@ class ComponentApi:
             if len(self.settings.message_list) > 1:
                 self.scroll_message_pos = -1
 
-        await self.settings.async_write_settings()
-        await self.coordinator.async_refresh()
+        await self.settings.async_write_view()
+        await self.async_request_refresh()
 
     # ------------------------------------------------------------------
     async def async_messagelist_show_service(self, call: ServiceCall) -> None:
@@ -300,74 +649,195 @@ class ComponentApi:
                 self.settings.message_list_show.succ(True)
             )
         else:
-            self.settings.message_list_orderby = MessageListOrderBy[
+            self.settings.message_list_show = MessageListShow[
                 call.data.get("show", "ALL").upper()
             ]
 
-        await self.settings.async_write_settings()
-        await self.coordinator.async_refresh()
+        await self.settings.async_write_view()
+        await self.async_request_refresh()
 
     # ------------------------------------------------------------------
     async def async_update(self) -> None:
         """Message log Update."""
 
         await self.translations.async_refresh()
-        await self.async_remove_outdated()
         # self.update_scroll_message_pos()
         await self.async_update_markdown()
 
     # ------------------------------------------------------------------
-    async def async_remove_outdated(self) -> None:
+    async def async_remove_outdated(self) -> list[MessageItem]:
         """Remove outdated."""
-        save_settings: bool = False
+        if not self.settings.loaded:
+            return []
 
-        for index, item in reversed(list(enumerate(self.settings.message_list))):
-            if item.remove_after < datetime.now(UTC):
-                save_settings = True
-                del self.settings.message_list[index]
+        removed_items: list[MessageItem] = self.settings.message_list.remove_expired(
+            datetime.now(UTC)
+        )
 
-        if save_settings:
+        if len(removed_items) > 0:
             self.settings.set_highest_message_level()
-            await self.settings.async_write_settings()
+            await self.settings.async_write_removed(removed_items)
+            await self.async_archive(removed_items)
+
+        return removed_items
+
+    # ------------------------------------------------------------------
+    def schedule_expiry(self) -> None:
+        """Schedule removal at the next remove_after time.
+
+        Not before the full message list is loaded, removal waits for it and
+        async_load_message_list schedules it.
+        """
+
+        if not self.settings.loaded:
+            return
+
+        next_expiry: datetime | None = self.settings.message_list.next_expiry
+
+        if next_expiry == self.expiry_scheduled_at:
+            return
+
+        self.cancel_expiry()
+
+        if next_expiry is not None:
+            self.expiry_scheduled_at = next_expiry
+            self.unsub_expiry = async_track_point_in_utc_time(
+                self.hass, self.async_handle_expiry, next_expiry
+            )
+
+    # ------------------------------------------------------------------
+    @callback
+    def cancel_expiry(self) -> None:
+        """Cancel scheduled removal."""
+
+        if self.unsub_expiry is not None:
+            self.unsub_expiry()
+            self.unsub_expiry = None
+
+        self.expiry_scheduled_at = None
+
+    # ------------------------------------------------------------------
+    async def async_handle_expiry(self, _now: datetime) -> None:
+        """Handle remove_after time reached."""
+
+        self.unsub_expiry = None
+        self.expiry_scheduled_at = None
+
+        if len(await self.async_remove_outdated()) > 0:
+            await self.coordinator.async_refresh()
+
+        self.schedule_expiry()
 
     # ------------------------------------------------------------------
     async def async_update_markdown(self) -> None:
         """Update markdown."""
-        self.create_sorted_message_list(self.settings.message_list_orderby)
+        await self.relative_time.async_set_language(self.translate.acive_language)
+        self.markdown_fragments.begin()
+
+        self.create_sorted_message_list(
+            self.settings.message_list_orderby, count=self.sorted_list_count
+        )
         await self.async_create_markdown_latest_and_scroll()
 
         self.create_sorted_message_list(
-            self.settings.message_list_orderby, self.settings.message_list_show
+            self.settings.message_list_orderby,
+            self.settings.message_list_show,
+            self.sorted_list_count,
         )
         await self.async_create_markdown_message_list()
         await self.async_create_markdown_message_settings()
 
         self.message_list_sorted.clear()
 
+    # ------------------------------------------------------------------
+    async def async_scroll(self) -> None:
+        """Advance the scroll message without a full refresh.
+
+        Renders the latest and scroll lines again. The message list markdown
+        is only assembled again when one of its relative times has changed.
+        """
+
+        if self.translations.language == "":
+            await self.coordinator.async_refresh()
+            return
+
+        self.create_sorted_message_list(
+            self.settings.message_list_orderby, count=self.sorted_list_count
+        )
+        await self.async_create_markdown_latest_and_scroll()
+
+        self.create_sorted_message_list(
+            self.settings.message_list_orderby,
+            self.settings.message_list_show,
+            self.sorted_list_count,
+        )
+
+        if (
+            self.relative_time_received(self.markdown_message_list_items)
+            != self.markdown_message_list_received
+        ):
+            await self.async_create_markdown_message_list()
+
+        self.message_list_sorted.clear()
+        self.coordinator.async_update_listeners()
+
+    # ------------------------------------------------------------------
+    @property
+    def sorted_list_count(self) -> int:
+        """Items needed from the sorted message list for scroll and markdown."""
+        return max(
+            int(self.entry.options.get(CONF_MARKDOWN_MESSAGE_LIST_COUNT, 10)),
+            int(self.entry.options.get(CONF_SCROLL_THROUGH_LAST_MESSAGES_COUNT, 5)),
+        )
+
+    # ------------------------------------------------------------------
+    @property
+    def markdown_message_list_items(self) -> list[MessageItem]:
+        """Items shown in the message list markdown."""
+        return self.message_list_sorted[
+            : int(self.entry.options.get(CONF_MARKDOWN_MESSAGE_LIST_COUNT, 10))
+        ]
+
     # ------------------------------------------------------------------
     async def async_create_markdown_latest_and_scroll(self) -> None:
         """Markdown latest and scroll."""
         # Latest message
         if len(self.settings.message_list) > 0:
-            item: MessageItem = self.settings.message_list[0]
+            items: list[MessageItem] = [self.settings.message_list[0]]
 
-            self.markdown = (
-                f'## <font color={self.settings.highest_message_level_color}>  <ha-icon icon="mdi:message-outline"></ha-icon></font> {self.translations.message_str}\n'
-                f'-  <font color={item.message_level_color}>  <ha-icon icon="{item.icon}"></ha-icon></font> <font size=3>{self.translations.last_message_str}: **{item.message}**</font>\n'
-                f"{await self.async_relative_time_received(item.added_at)}.\n\n"
-            )
-
-            # Scroll message
             if len(self.message_list_sorted) > 1:
                 self.update_scroll_message_pos()
+                items.append(self.message_list_sorted[self.scroll_message_pos])
 
-                item: MessageItem = self.message_list_sorted[self.scroll_message_pos]
-                self.markdown += (
-                    f'- <font color={item.message_level_color}>  <ha-icon icon="{item.icon}"></ha-icon></font> {self.translations.messages_str}: **{item.message}**\n'
-                    f"{await self.async_relative_time_received(item.added_at)}. "
+            received: list[str] = self.relative_time_received(items)
+
+            self.markdown = self.markdown_layout.header.render(
+                {
+                    "color": self.settings.highest_message_level_color,
+                    "label": self.translations.message_str,
+                }
+            ) + self.markdown_fragments.get(
+                self.markdown_layout.latest,
+                items[0],
+                received[0],
+                self.translations.last_message_str,
+            )
+
+            # Scroll message
+            if len(items) > 1:
+                self.markdown += self.markdown_fragments.get(
+                    self.markdown_layout.scroll,
+                    items[1],
+                    received[1],
+                    self.translations.messages_str,
                 )
         else:
-            self.markdown = f'## <font color={MessageLevel.INFO.color}>  <ha-icon icon="mdi:message-outline"></ha-icon></font> {self.translations.message_str}\n'
+            self.markdown = self.markdown_layout.header.render(
+                {
+                    "color": MessageLevel.INFO.color,
+                    "label": self.translations.message_str,
+                }
+            )
 
     # ------------------------------------------------------------------
     def update_scroll_message_pos(self) -> None:
@@ -389,22 +859,36 @@ class ComponentApi:
         """Markdown message list."""
         # Create markdown list
         if len(self.message_list_sorted) > 0:
-            count_pos: int = 1
-            self.markdown_message_list = f'## <font color={self.settings.highest_message_level_color}>  <ha-icon icon="mdi:message-outline"></ha-icon></font> {self.translations.messages_str}\n'
-
-            for item in self.message_list_sorted:
-                if count_pos > self.entry.options.get(
-                    CONF_MARKDOWN_MESSAGE_LIST_COUNT, 10
-                ):
-                    break
-
-                self.markdown_message_list += (
-                    f'- <font color={item.message_level_color}>  <ha-icon icon="{item.icon}"></ha-icon></font> **{item.message}**\n'
-                    f"{await self.async_relative_time_received(item.added_at)}.\n"
+            parts: list[str] = [
+                self.markdown_layout.header.render(
+                    {
+                        "color": self.settings.highest_message_level_color,
+                        "label": self.translations.messages_str,
+                    }
+                )
+            ]
+
+            items: list[MessageItem] = self.markdown_message_list_items
+            self.markdown_message_list_received = self.relative_time_received(items)
+
+            parts.extend(
+                self.markdown_fragments.get(
+                    self.markdown_layout.list_item, item, received
+                )
+                for item, received in zip(
+                    items, self.markdown_message_list_received, strict=True
                 )
-                count_pos += 1
+            )
+
+            self.markdown_message_list = "".join(parts)
         else:
-            self.markdown_message_list = f'## <font color={MessageLevel.INFO.color}>  <ha-icon icon="mdi:message-outline"></ha-icon></font> {self.translations.message_str}\n'
+            self.markdown_message_list_received = []
+            self.markdown_message_list = self.markdown_layout.header.render(
+                {
+                    "color": MessageLevel.INFO.color,
+                    "label": self.translations.message_str,
+                }
+            )
 
     # ------------------------------------------------------------------
     async def async_create_markdown_message_settings(self) -> None:
@@ -428,11 +912,15 @@ class ComponentApi:
             case MessageListShow.ERROR:
                 show: str = self.translations.error_str
 
+        if self.markdown_message_settings_key == (orderby, show):
+            return
+
         self.markdown_message_settings = await self.translate.async_get_localized_str(
             TRANSLATE_EXTRA + ".message_settings",
             orderby=orderby,
             show=show,
         )
+        self.markdown_message_settings_key = (orderby, show)
 
         # self.markdown_message_settings = (
         #     "|Opsætning| |\n"
@@ -446,32 +934,14 @@ class ComponentApi:
         self,
         orderby: MessageListOrderBy = MessageListOrderBy.MESSAGE_LEVEL,
         show: MessageListShow = MessageListShow.ALL,
+        count: int = 0,
     ) -> None:
-        """Create sorted message list."""
-        self.message_list_sorted.clear()
-
-        if orderby == MessageListOrderBy.MESSAGE_LEVEL:
-            for message_level in reversed(MessageLevel):
-                self.message_list_sorted.extend(
-                    [
-                        x
-                        for x in self.settings.message_list
-                        if x.message_level == message_level
-                        and (
-                            show == MessageListShow.ALL
-                            or x.message_level.name == show.name
-                        )
-                    ]
-                )
-
-        else:
-            self.message_list_sorted.extend(
-                [
-                    x
-                    for x in self.settings.message_list
-                    if show == MessageListShow.ALL or x.message_level.name == show.name
-                ]
-            )
+        """Create sorted message list with the first count items, 0 is all."""
+        self.message_list_sorted = self.settings.message_list.top(
+            count,
+            orderby == MessageListOrderBy.MESSAGE_LEVEL,
+            None if show == MessageListShow.ALL else MessageLevel[show.name],
+        )
 
     # ------------------------------------------------------------------
     def get_message(self, num: int = 0) -> str:
@@ -11,6 +11,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.schema_config_entry_flow import (
     SchemaCommonFlowHandler,
     SchemaConfigFlowHandler,
+    SchemaFlowError,
     SchemaFlowFormStep,
     SchemaFlowMenuStep,
 )
@@ -22,21 +23,44 @@ from homeassistant.helpers.selector import (
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+    TextSelector,
+    TextSelectorConfig,
 )
 from homeassistant.util.uuid import random_uuid_hex
 
 from .const import (
+    CONF_ARCHIVE_MAX_SEGMENTS,
+    CONF_ARCHIVE_REMOVED_MESSAGES,
+    CONF_DEDUP_WINDOW_MINUTES,
     CONF_DEFAULT_ICON,
+    CONF_INGEST_WINDOW_MILLISECONDS,
     CONF_LISTEN_TO_TIMER_TRIGGER,
+    CONF_MARKDOWN_ITEM_TEMPLATE,
+    CONF_MARKDOWN_LAYOUT,
     CONF_MARKDOWN_MESSAGE_LIST_COUNT,
+    CONF_MAX_MESSAGES,
+    CONF_MAX_STORED_KILOBYTES,
     CONF_ORDER_BY_MESSAGE_LEVEL,
+    CONF_OVERFLOW_POLICY,
+    CONF_OVERFLOW_SAMPLE_RATE,
+    CONF_RATE_LIMIT_PER_SOURCE,
+    CONF_RATE_LIMIT_TOTAL,
+    CONF_REFRESH_COOLDOWN_SECONDS,
     CONF_REMOVE_MESSAGE_AFTER_HOURS,
     CONF_RESTART_TIMER,
     CONF_SCROLL_MESSAGES_EVERY_MINUTES,
     CONF_SCROLL_THROUGH_LAST_MESSAGES_COUNT,
+    CONF_USE_JOURNAL,
+    CONF_WRITE_DELAY_SECONDS,
     DOMAIN,
     DOMAIN_NAME,
+    OVERFLOW_POLICIES,
+    OVERFLOW_POLICY_DROP_OLDEST_INFO,
 )
+from .markdown import MARKDOWN_LAYOUT_DEFAULT, MARKDOWN_LAYOUTS, MarkdownTemplate
 
 CONFIG_OPTIONS_SCHEMA = vol.Schema(
     {
@@ -94,6 +118,133 @@ CONFIG_OPTIONS_SCHEMA = vol.Schema(
                 unit_of_measurement="count",
             )
         ),
+        vol.Required(
+            CONF_MARKDOWN_LAYOUT,
+            default=MARKDOWN_LAYOUT_DEFAULT,
+        ): SelectSelector(
+            SelectSelectorConfig(
+                options=list(MARKDOWN_LAYOUTS),
+                mode=SelectSelectorMode.DROPDOWN,
+                translation_key=CONF_MARKDOWN_LAYOUT,
+            )
+        ),
+        vol.Optional(
+            CONF_MARKDOWN_ITEM_TEMPLATE,
+            default="",
+        ): TextSelector(TextSelectorConfig(multiline=True)),
+        vol.Required(
+            CONF_MAX_MESSAGES,
+            default=0,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=1000000,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="count",
+            )
+        ),
+        vol.Required(
+            CONF_MAX_STORED_KILOBYTES,
+            default=0,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=1000000,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="kB",
+            )
+        ),
+        vol.Required(
+            CONF_OVERFLOW_POLICY,
+            default=OVERFLOW_POLICY_DROP_OLDEST_INFO,
+        ): SelectSelector(
+            SelectSelectorConfig(
+                options=OVERFLOW_POLICIES,
+                mode=SelectSelectorMode.DROPDOWN,
+                translation_key=CONF_OVERFLOW_POLICY,
+            )
+        ),
+        vol.Required(
+            CONF_OVERFLOW_SAMPLE_RATE,
+            default=10,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=1,
+                max=10000,
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Required(
+            CONF_DEDUP_WINDOW_MINUTES,
+            default=0,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=10080,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="minutes",
+            )
+        ),
+        vol.Required(
+            CONF_INGEST_WINDOW_MILLISECONDS,
+            default=50,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=5000,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="ms",
+            )
+        ),
+        vol.Required(
+            CONF_REFRESH_COOLDOWN_SECONDS,
+            default=1,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=60,
+                step=0.1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="seconds",
+            )
+        ),
+        vol.Required(
+            CONF_RATE_LIMIT_PER_SOURCE,
+            default=0,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=100000,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="messages/min",
+            )
+        ),
+        vol.Required(
+            CONF_RATE_LIMIT_TOTAL,
+            default=0,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=100000,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="messages/min",
+            )
+        ),
+        vol.Optional(
+            CONF_ARCHIVE_REMOVED_MESSAGES,
+            default=False,
+        ): BooleanSelector(),
+        vol.Required(
+            CONF_ARCHIVE_MAX_SEGMENTS,
+            default=10,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=1,
+                max=1000,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="count",
+            )
+        ),
         vol.Required(
             CONF_DEFAULT_ICON,
             default="mdi:message-badge-outline",
@@ -102,10 +253,39 @@ CONFIG_OPTIONS_SCHEMA = vol.Schema(
             CONF_ORDER_BY_MESSAGE_LEVEL,
             default=True,
         ): cv.boolean,
+        vol.Optional(
+            CONF_USE_JOURNAL,
+            default=False,
+        ): BooleanSelector(),
+        vol.Required(
+            CONF_WRITE_DELAY_SECONDS,
+            default=2,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=60,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="seconds",
+            )
+        ),
     }
 )
 
 
+# ------------------------------------------------------------------
+async def validate_options(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate the markdown item template."""
+
+    try:
+        MarkdownTemplate(user_input.get(CONF_MARKDOWN_ITEM_TEMPLATE, ""))
+    except ValueError as err:
+        raise SchemaFlowError("invalid_markdown_template") from err
+
+    return user_input
+
+
 # ------------------------------------------------------------------
 async def config_schema_handler(
     handler: SchemaCommonFlowHandler,
@@ -120,10 +300,14 @@ async def config_schema_handler(
 
 
 CONFIG_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
-    "user": SchemaFlowFormStep(config_schema_handler),
+    "user": SchemaFlowFormStep(
+        config_schema_handler, validate_user_input=validate_options
+    ),
 }
 OPTIONS_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
-    "init": SchemaFlowFormStep(CONFIG_OPTIONS_SCHEMA),
+    "init": SchemaFlowFormStep(
+        CONFIG_OPTIONS_SCHEMA, validate_user_input=validate_options
+    ),
 }
 
 
@@ -14,13 +14,38 @@ CONF_MARKDOWN_MESSAGE_LIST_COUNT: str = "markdown_message_list_count"
 CONF_ORDER_BY_MESSAGE_LEVEL: str = "order_by_message_level"
 CONF_RESTART_TIMER = "restart_timer"
 CONF_LISTEN_TO_TIMER_TRIGGER = "listen_to_timer_trigger"
+CONF_USE_JOURNAL: str = "use_journal"
+CONF_WRITE_DELAY_SECONDS: str = "write_delay_seconds"
+CONF_MAX_MESSAGES: str = "max_messages"
+CONF_MAX_STORED_KILOBYTES: str = "max_stored_kilobytes"
+CONF_ARCHIVE_REMOVED_MESSAGES: str = "archive_removed_messages"
+CONF_ARCHIVE_MAX_SEGMENTS: str = "archive_max_segments"
+CONF_DEDUP_WINDOW_MINUTES: str = "dedup_window_minutes"
+CONF_INGEST_WINDOW_MILLISECONDS: str = "ingest_window_milliseconds"
+CONF_RATE_LIMIT_PER_SOURCE: str = "rate_limit_per_source"
+CONF_RATE_LIMIT_TOTAL: str = "rate_limit_total"
+CONF_OVERFLOW_POLICY: str = "overflow_policy"
+CONF_OVERFLOW_SAMPLE_RATE: str = "overflow_sample_rate"
+CONF_REFRESH_COOLDOWN_SECONDS: str = "refresh_cooldown_seconds"
+
+OVERFLOW_POLICY_DROP_OLDEST_INFO = "drop_oldest_info"
+OVERFLOW_POLICY_DROP_INCOMING = "drop_incoming"
+OVERFLOW_POLICY_SAMPLE_INFO = "sample_info"
+OVERFLOW_POLICIES: list[str] = [
+    OVERFLOW_POLICY_DROP_OLDEST_INFO,
+    OVERFLOW_POLICY_DROP_INCOMING,
+    OVERFLOW_POLICY_SAMPLE_INFO,
+]
+CONF_MARKDOWN_LAYOUT: str = "markdown_layout"
+CONF_MARKDOWN_ITEM_TEMPLATE: str = "markdown_item_template"
 
 TRANSLATION_KEY = DOMAIN
 TRANSLATE_EXTRA = "options.step.extra.data"
 TRANSLATION_KEY_MISSING_TIMER_ENTITY = "missing_timer_entity"
 
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 STORAGE_KEY = DOMAIN
+STORAGE_KEY_VIEW = DOMAIN + ".view"
 
 EVENT_NEW_LOG_ENTRY = "new_log_entry"
 EVENT_NEW_NOTIFY_LOG_ENTRY = "new_notify_log_entry"
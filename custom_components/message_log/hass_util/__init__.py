@@ -5,9 +5,11 @@ It includes functions for handling retries, managing timers, and translating tex
 
 External imports:
     handle_retries: None
+    relative_time: babel
     storage_json: jsonpickle
+    storage_journal: orjson
     timer_trigger: None
-    translate: aiofiles, orjson
+    translate: orjson
 """
 
 from .config_update import (
@@ -24,11 +26,15 @@ from .handle_retries import (
 from .hass_util import (
     ArgumentException,
     AsyncException,
+    UserLanguageCache,
     async_get_user_language,
     async_hass_add_executor_job,
     object_to_state_attr_dict,
+    release_user_language_cache,
 )
 from .json_ext import DictToObject, JsonExt
+from .relative_time import RelativeTime
+from .storage_journal import StorageJournal
 from .storage_json import StorageJson, StoreMigrate
 from .timer_trigger import TimerTrigger, TimerTriggerErrorEnum
 from .translate import NumberSelectorConfigTranslate, Translate
@@ -42,16 +48,20 @@ __all__ = [
     "HandleRetriesException",
     "JsonExt",
     "NumberSelectorConfigTranslate",
+    "RelativeTime",
     "RetryStopException",
+    "StorageJournal",
     "StorageJson",
     "StoreMigrate",
     "TimerTrigger",
     "TimerTriggerErrorEnum",
     "Translate",
+    "UserLanguageCache",
     "async_get_user_language",
     "async_hass_add_executor_job",
     "check_supress_config_update_listener",
     "handle_retries",
     "object_to_state_attr_dict",
+    "release_user_language_cache",
     "set_supress_config_update_listener",
 ]
@@ -7,10 +7,13 @@ from packaging.version import Version
 
 from homeassistant.components.frontend import storage as frontend_store
 from homeassistant.const import (
+    EVENT_CORE_CONFIG_UPDATE,
     MAJOR_VERSION as HASS_MAJOR_VERSION,
     MINOR_VERSION as HASS_MINOR_VERSION,
 )
-from homeassistant.core import HomeAssistant, async_get_hass
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, async_get_hass, callback
+
+USER_LANGUAGE_KEY = "hass_util_user_language"
 
 
 # ------------------------------------------------------
@@ -57,11 +60,65 @@ def object_to_state_attr_dict(
     return state_attr_dict
 
 
+# ------------------------------------------------------
+# ------------------------------------------------------
+class UserLanguageCache:
+    """Cached user language.
+
+    Cleared on core config updates and when the owner's frontend language
+    changes. The listeners are kept until release_user_language_cache.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+
+        self.language: str | None = None
+        self.unsub_core_config: CALLBACK_TYPE | None = None
+        self.unsub_user_data: CALLBACK_TYPE | None = None
+
+    # ------------------------------------------------------
+    @callback
+    def clear(self, *_args) -> None:
+        """Clear the cached language."""
+        self.language = None
+
+    # ------------------------------------------------------
+    @callback
+    def release(self) -> None:
+        """Clear the cached language and remove the listeners."""
+
+        self.language = None
+
+        if self.unsub_core_config is not None:
+            self.unsub_core_config()
+            self.unsub_core_config = None
+
+        if self.unsub_user_data is not None:
+            self.unsub_user_data()
+            self.unsub_user_data = None
+
+
 # ------------------------------------------------------
 async def async_get_user_language() -> str:
-    """Execute a method in async mode in hass."""
+    """Get the owner's frontend language or the configured language.
+
+    Cached until the core config or the owner's frontend language changes.
+    Home Assistant before 2025.6 can not report frontend user data changes,
+    so the language is not cached there.
+    """
 
     hass: HomeAssistant = async_get_hass()
+    cache: UserLanguageCache = hass.data.setdefault(
+        USER_LANGUAGE_KEY, UserLanguageCache()
+    )
+
+    if cache.language is not None:
+        return cache.language
+
+    if cache.unsub_core_config is None:
+        cache.unsub_core_config = hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE, cache.clear
+        )
 
     language: str = hass.config.language
 
@@ -73,15 +130,33 @@ async def async_get_user_language() -> str:
 
             if "language" in owner_data and "language" in owner_data["language"]:
                 language = owner_data["language"]["language"]
-    elif owner is not None:
-        owner_data = await frontend_store.async_user_store(hass, owner.id)
 
+        return language
+
+    if owner is not None:
         owner_data = await frontend_store.async_user_store(hass, owner.id)
+
         if "language" in owner_data.data and "language" in owner_data.data["language"]:
             language = owner_data.data["language"]["language"]
+
+        if cache.unsub_user_data is None:
+            cache.unsub_user_data = owner_data.async_subscribe("language", cache.clear)
+
+    cache.language = language
     return language
 
 
+# ------------------------------------------------------
+@callback
+def release_user_language_cache(hass: HomeAssistant) -> None:
+    """Release the user language cache, e.g. when the entry is unloaded."""
+
+    cache: UserLanguageCache | None = hass.data.pop(USER_LANGUAGE_KEY, None)
+
+    if cache is not None:
+        cache.release()
+
+
 # ------------------------------------------------------
 def async_hass_add_executor_job(
     func=None,
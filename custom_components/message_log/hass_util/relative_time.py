@@ -0,0 +1,109 @@
+"""Relative time.
+
+External imports: babel
+"""
+
+from collections.abc import Iterable
+from math import floor
+from time import time
+
+from babel import Locale
+from babel.dates import TIMEDELTA_UNITS, format_timedelta
+
+from homeassistant.core import HomeAssistant
+
+RELATIVE_TIME_THRESHOLD = 0.85
+RELATIVE_TIME_GRANULARITY = "second"
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class RelativeTime:
+    """Relative time formatter.
+
+    Formats in the event loop. The babel Locale is loaded in the executor
+    once per language, and results are memoized per language, direction,
+    unit and rounded value, which is all format_timedelta depends on.
+
+    External imports: babel
+    """
+
+    MEMO_SIZE: int = 1024
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.language: str = ""
+        self.locale: Locale | None = None
+        self.locales: dict[str, Locale] = {}
+        self.memo: dict[tuple[str, bool, str, int], str] = {}
+
+    # ------------------------------------------------------------------
+    async def async_set_language(self, language: str) -> None:
+        """Set language, loading its locale data in the executor once."""
+
+        if language == self.language and self.locale is not None:
+            return
+
+        if language not in self.locales:
+            self.locales[language] = await self.hass.async_add_executor_job(
+                self.load_locale, language
+            )
+
+        self.language = language
+        self.locale = self.locales[language]
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def load_locale(language: str) -> Locale:
+        """Load locale with its data."""
+
+        locale: Locale = Locale.parse((language or "en").replace("-", "_"))
+        # Accessing a property loads the locale data from disk
+        locale.plural_form  # noqa: B018
+        return locale
+
+    # ------------------------------------------------------------------
+    def bucket(self, seconds: int) -> tuple[str, bool, str, int]:
+        """Memo key, same unit selection and rounding as format_timedelta."""
+
+        for unit, secs_per_unit in TIMEDELTA_UNITS:
+            value: float = abs(seconds) / secs_per_unit
+
+            if value >= RELATIVE_TIME_THRESHOLD or unit == RELATIVE_TIME_GRANULARITY:
+                if unit == RELATIVE_TIME_GRANULARITY and value > 0:
+                    value = max(1, value)
+
+                return (self.language, seconds >= 0, unit, round(value))
+
+        return (self.language, seconds >= 0, "", 0)
+
+    # ------------------------------------------------------------------
+    def format(self, timestamp: float, now: float | None = None) -> str:
+        """Format timestamp relative to now, e.g. '5 minutes ago'."""
+
+        seconds: int = floor(timestamp - (time() if now is None else now))
+        key: tuple[str, bool, str, int] = self.bucket(seconds)
+
+        if (result := self.memo.get(key)) is None:
+            if len(self.memo) >= self.MEMO_SIZE:
+                self.memo.clear()
+
+            result = format_timedelta(
+                seconds,
+                threshold=RELATIVE_TIME_THRESHOLD,
+                granularity=RELATIVE_TIME_GRANULARITY,
+                add_direction=True,
+                locale=self.locale or self.language or "en",
+            )
+            self.memo[key] = result
+
+        return result
+
+    # ------------------------------------------------------------------
+    def format_batch(self, timestamps: Iterable[float]) -> list[str]:
+        """Format timestamps relative to the same now."""
+
+        now: float = time()
+        return [self.format(timestamp, now) for timestamp in timestamps]
@@ -0,0 +1,114 @@
+"""Append-only journal storage.
+
+External imports: orjson
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class StorageJournal:
+    """Append-only journal storage class.
+
+    Records are appended as json lines next to the Home Assistant storage
+    file. The owner replays them on load and compacts them into a snapshot
+    when compact_needed is True.
+
+    External imports: orjson
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        compact_after: int = 500,
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.path: Path = Path(hass.config.path(STORAGE_DIR, key + ".journal"))
+        self.compact_after: int = compact_after
+        self.record_count: int = 0
+        self.lock: asyncio.Lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    @property
+    def compact_needed(self) -> bool:
+        """Journal has grown enough to be compacted into a snapshot."""
+        return self.record_count >= self.compact_after
+
+    # ------------------------------------------------------------------
+    async def async_append(self, records: list[dict[str, Any]]) -> None:
+        """Append records to the journal."""
+
+        if len(records) == 0:
+            return
+
+        data: bytes = b"".join(orjson.dumps(record) + b"\n" for record in records)
+
+        async with self.lock:
+            await self.hass.async_add_executor_job(self._append, data)
+            self.record_count += len(records)
+
+    # ------------------------------------------------------------------
+    def _append(self, data: bytes) -> None:
+        """Append data to the journal file."""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.path.open("ab") as journal_file:
+            journal_file.write(data)
+
+    # ------------------------------------------------------------------
+    async def async_load(self) -> list[dict[str, Any]]:
+        """Load all records from the journal."""
+
+        async with self.lock:
+            records: list[dict[str, Any]] = await self.hass.async_add_executor_job(
+                self.load
+            )
+            self.record_count = len(records)
+
+        return records
+
+    # ------------------------------------------------------------------
+    def load(self) -> list[dict[str, Any]]:
+        """Load all records from the journal file.
+
+        A partly written last line, e.g. after a power cut, is skipped.
+        """
+
+        if not self.path.is_file():
+            return []
+
+        records: list[dict[str, Any]] = []
+
+        with self.path.open("rb") as journal_file:
+            for line in journal_file:
+                try:
+                    records.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue
+
+        return records
+
+    # ------------------------------------------------------------------
+    async def async_truncate(self) -> None:
+        """Truncate the journal after a snapshot has been written."""
+
+        async with self.lock:
+            await self.hass.async_add_executor_job(self._remove)
+            self.record_count = 0
+
+    # ------------------------------------------------------------------
+    def _remove(self) -> None:
+        """Remove the journal file."""
+        self.path.unlink(missing_ok=True)
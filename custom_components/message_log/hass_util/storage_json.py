@@ -9,7 +9,9 @@ from typing import Any
 
 import jsonpickle
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 
 
@@ -58,8 +60,13 @@ class StorageJson:
         version: int = 1,
         minor_version: int = 1,
         async_migrate_func: Callable[[int, int, Any], Any] | None = None,
+        write_delay: float = 0,
     ) -> None:
-        """Init."""
+        """Init.
+
+        write_delay is the max number of seconds async_write_settings_delayed
+        may hold back a write. Pending writes are flushed on final write.
+        """
 
         self.DICT_KEY___ = "jsonpickle"
         self.write_hidden_attributes___: bool = False
@@ -72,6 +79,10 @@ class StorageJson:
         )
         self.store___.custom_migrate_func = async_migrate_func
         self.base_class___ = self.__class__ is StorageJson
+        self.write_delay___: float = write_delay
+        self.write_pending___: bool = False
+        self.unsub_write_delay___: CALLBACK_TYPE | None = None
+        self.unsub_final_write___: CALLBACK_TYPE | None = None
 
     # ------------------------------------------------------------------
     async def async_read_settings(self) -> dict | None:
@@ -121,6 +132,64 @@ class StorageJson:
                 {self.DICT_KEY___: self.encode_data(self), **extra_data}
             )
 
+    # ------------------------------------------------------------------
+    async def async_write_settings_delayed(self) -> None:
+        """Write settings at the latest after write_delay seconds.
+
+        Writes requested while one is pending are coalesced into that write.
+        """
+
+        self.write_pending___ = True
+
+        if self.write_delay___ <= 0:
+            await self.async_flush_settings()
+            return
+
+        if self.unsub_write_delay___ is None:
+            self.unsub_write_delay___ = async_call_later(
+                self.hass___, self.write_delay___, self._async_handle_write_delay
+            )
+
+        if self.unsub_final_write___ is None:
+            self.unsub_final_write___ = self.hass___.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_handle_final_write
+            )
+
+    # ------------------------------------------------------------------
+    async def async_flush_settings(self) -> None:
+        """Write pending settings now."""
+
+        if self.unsub_write_delay___ is not None:
+            self.unsub_write_delay___()
+            self.unsub_write_delay___ = None
+
+        if self.unsub_final_write___ is not None:
+            self.unsub_final_write___()
+            self.unsub_final_write___ = None
+
+        if self.write_pending___:
+            self.write_pending___ = False
+            await self.async_write_pending()
+
+    # ------------------------------------------------------------------
+    async def async_write_pending(self) -> None:
+        """Write what is pending. Override for partial writes."""
+        await self.async_write_settings()
+
+    # ------------------------------------------------------------------
+    async def _async_handle_write_delay(self, _now: Any) -> None:
+        """Handle write delay expired."""
+
+        self.unsub_write_delay___ = None
+        await self.async_flush_settings()
+
+    # ------------------------------------------------------------------
+    async def _async_handle_final_write(self, _event: Event) -> None:
+        """Handle Home Assistant final write."""
+
+        self.unsub_final_write___ = None
+        await self.async_flush_settings()
+
     # ------------------------------------------------------------------
     def encode_data(self, data: Any):
         """Encode data."""
@@ -129,6 +198,8 @@ class StorageJson:
     # ------------------------------------------------------------------
     async def async_remove_settings(self) -> None:
         """Remove settings."""
+        self.write_pending___ = False
+        await self.async_flush_settings()
         await self.store___.async_remove()
 
     # ------------------------------------------------------------------
@@ -140,6 +211,10 @@ class StorageJson:
         del tmp_dict["store___"]
         del tmp_dict["DICT_KEY___"]
         del tmp_dict["base_class___"]
+        del tmp_dict["write_delay___"]
+        del tmp_dict["write_pending___"]
+        del tmp_dict["unsub_write_delay___"]
+        del tmp_dict["unsub_final_write___"]
 
         if self.write_hidden_attributes___ is False:
             try:
@@ -148,13 +223,14 @@ class StorageJson:
                     for key in list(obj):
                         if len(key) > 2 and key[0:2] == "__":
                             continue
-                        elif hasattr(obj[key], "__dict__"):  # noqa: RET507
-                            remove_hidden_attrib(obj[key].__dict__)
 
                         # Remove hidden attributes
-                        elif len(key) > 3 and key[-3:] == "___":
+                        elif len(key) > 3 and key[-3:] == "___":  # noqa: RET507
                             del obj[key]
 
+                        elif hasattr(obj[key], "__dict__"):
+                            remove_hidden_attrib(obj[key].__dict__)
+
                         elif isinstance(obj[key], list):
                             for item in obj[key]:
                                 if hasattr(item, "__dict__"):
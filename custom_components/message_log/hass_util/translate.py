@@ -1,12 +1,12 @@
 """Translate to localized string.
 
-External imports: aiofiles, orjson
+External imports: orjson
 """
 
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Literal
 
-import aiofiles
 import orjson
 
 from homeassistant.core import HomeAssistant
@@ -74,11 +74,17 @@ class NumberSelectorConfigTranslate:
 class Translate:
     """Translate to localized string class.
 
+    Flattened translation files are kept in a class level LRU cache keyed by
+    language, file name and load_only, with hit and miss counters.
+
     External imports: orjson
     """
 
-    __filename: str = ""
-    __json_dict: dict[str, Any] = {}
+    CACHE_SIZE: int = 8
+
+    __cache: OrderedDict[tuple[str, str, str], dict[str, Any]] = OrderedDict()
+    cache_hits: int = 0
+    cache_misses: int = 0
     acive_language: str = ""
 
     def __init__(self, hass: HomeAssistant, load_only: str = "") -> None:
@@ -104,20 +110,45 @@ class Translate:
         if language is None:
             language = await async_get_user_language()
 
-        await self.__async_check_language_loaded(
+        json_dict: dict[str, Any] = await self.__async_get_json_dict(
             str(language), file_name=file_name, load_only=load_only
         )
 
         if len(kvargs) == 0:
-            return Translate.__json_dict.get(key, default)
+            return json_dict.get(key, default)
 
-        return str(Translate.__json_dict.get(key, default)).format(**kvargs)
+        return str(json_dict.get(key, default)).format(**kvargs)
 
     # ------------------------------------------------------------------
-    async def __async_check_language_loaded(
+    async def __async_get_json_dict(
         self, language: str, file_name: str = ".json", load_only: str = ""
-    ) -> None:
-        """Check language."""
+    ) -> dict[str, Any]:
+        """Get the flattened translations from the cache or load them."""
+
+        Translate.acive_language = language
+        cache_key: tuple[str, str, str] = (language, file_name, load_only)
+
+        if (json_dict := Translate.__cache.get(cache_key)) is not None:
+            Translate.__cache.move_to_end(cache_key)
+            Translate.cache_hits += 1
+            return json_dict
+
+        Translate.cache_misses += 1
+        json_dict = await self.hass.async_add_executor_job(
+            self.load, language, file_name, load_only
+        )
+
+        Translate.__cache[cache_key] = json_dict
+
+        if len(Translate.__cache) > Translate.CACHE_SIZE:
+            Translate.__cache.popitem(last=False)
+
+        return json_dict
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def load(language: str, file_name: str = ".json", load_only: str = "") -> dict:
+        """Load and flatten a translation file, falling back to english."""
 
         # ------------------------------------------------------------------
         def recursive_flatten(
@@ -146,13 +177,6 @@ class Translate:
             )
 
             if not filename.is_file():
-                return
-
-        if Translate.__filename != str(filename):
-            Translate.__filename = str(filename)
-            Translate.acive_language = language
+                return {}
 
-            async with aiofiles.open(str(filename)) as json_file:
-                Translate.__json_dict = recursive_flatten(
-                    "", orjson.loads(await json_file.read()), load_only
-                )
+        return recursive_flatten("", orjson.loads(filename.read_bytes()), load_only)
@@ -0,0 +1,165 @@
+"""Markdown templates."""
+
+from string import Formatter
+
+from .message_log_settings import MessageItem
+
+MARKDOWN_FIELDS: frozenset[str] = frozenset(
+    {"color", "icon", "label", "level", "message", "received", "source"}
+)
+MARKDOWN_RECEIVED_FIELD = "received"
+
+MARKDOWN_LAYOUT_DEFAULT = "default"
+MARKDOWN_LAYOUT_COMPACT = "compact"
+
+MARKDOWN_LAYOUTS: dict[str, dict[str, str]] = {
+    MARKDOWN_LAYOUT_DEFAULT: {
+        "header": '## <font color={color}>  <ha-icon icon="mdi:message-outline"></ha-icon></font> {label}\n',
+        "latest": '-  <font color={color}>  <ha-icon icon="{icon}"></ha-icon></font> <font size=3>{label}: **{message}**</font>\n{received}.\n\n',
+        "scroll": '- <font color={color}>  <ha-icon icon="{icon}"></ha-icon></font> {label}: **{message}**\n{received}. ',
+        "list_item": '- <font color={color}>  <ha-icon icon="{icon}"></ha-icon></font> **{message}**\n{received}.\n',
+    },
+    # Plain markdown without html, for dashboards showing long lists
+    MARKDOWN_LAYOUT_COMPACT: {
+        "header": "### {label}\n",
+        "latest": "**{message}**\n{received}.\n\n",
+        "scroll": "{label}: **{message}** {received}. ",
+        "list_item": "- **{message}** {received}.\n",
+    },
+}
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class MarkdownTemplate:
+    """Markdown template compiled once into literal text and fields.
+
+    Fields are {color}, {icon}, {label}, {level}, {message}, {received} and
+    {source}. The text around {received} can be rendered and cached ahead,
+    so only the relative time is joined in on each refresh.
+    """
+
+    def __init__(self, template: str) -> None:
+        """Init, raises ValueError for an invalid template."""
+
+        self.template: str = template
+        self.parts: list[tuple[str, str | None]] = []
+
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if field_name is not None and (
+                field_name not in MARKDOWN_FIELDS or format_spec or conversion
+            ):
+                raise ValueError(f"Invalid markdown template field {{{field_name}}}")
+
+            self.parts.append((literal, field_name))
+
+    # ------------------------------------------------------------------
+    def render_segments(self, values: dict[str, str]) -> tuple[str, ...]:
+        """Render all fields but {received}, split where it goes."""
+
+        segments: list[str] = []
+        current: list[str] = []
+
+        for literal, field_name in self.parts:
+            current.append(literal)
+
+            if field_name == MARKDOWN_RECEIVED_FIELD:
+                segments.append("".join(current))
+                current = []
+            elif field_name is not None:
+                current.append(values.get(field_name, ""))
+
+        segments.append("".join(current))
+        return tuple(segments)
+
+    # ------------------------------------------------------------------
+    def render(self, values: dict[str, str], received: str = "") -> str:
+        """Render."""
+        return received.join(self.render_segments(values))
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class MarkdownLayout:
+    """Compiled markdown templates of a layout."""
+
+    def __init__(
+        self, layout: str = MARKDOWN_LAYOUT_DEFAULT, list_item: str = ""
+    ) -> None:
+        """Init, list_item overrides the layout's list item template."""
+
+        templates: dict[str, str] = MARKDOWN_LAYOUTS.get(
+            layout, MARKDOWN_LAYOUTS[MARKDOWN_LAYOUT_DEFAULT]
+        )
+
+        self.header: MarkdownTemplate = MarkdownTemplate(templates["header"])
+        self.latest: MarkdownTemplate = MarkdownTemplate(templates["latest"])
+        self.scroll: MarkdownTemplate = MarkdownTemplate(templates["scroll"])
+        self.list_item: MarkdownTemplate = MarkdownTemplate(
+            list_item or templates["list_item"]
+        )
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class MarkdownFragments:
+    """Cache of rendered markdown fragments per message item.
+
+    A fragment is kept for as long as the item is rendered and is rendered
+    again when the item's level, icon, message, count or the label changes.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+
+        self.fragments: dict[tuple[int, str], tuple[tuple, tuple[str, ...]]] = {}
+        self.previous_fragments: dict[
+            tuple[int, str], tuple[tuple, tuple[str, ...]]
+        ] = {}
+
+    # ------------------------------------------------------------------
+    def begin(self) -> None:
+        """Begin a render, fragments not used in it are dropped."""
+
+        self.previous_fragments = self.fragments
+        self.fragments = {}
+
+    # ------------------------------------------------------------------
+    def get(
+        self,
+        template: MarkdownTemplate,
+        item: MessageItem,
+        received: str,
+        label: str = "",
+    ) -> str:
+        """Get the fragment for item with the relative time joined in."""
+
+        key: tuple[int, str] = (id(template), item.uid)
+        stamp: tuple = (
+            item.message_level.value,
+            item.icon,
+            item.message,
+            item.count,
+            label,
+        )
+        cached: tuple[tuple, tuple[str, ...]] | None = self.fragments.get(
+            key
+        ) or self.previous_fragments.get(key)
+
+        if cached is None or cached[0] != stamp:
+            cached = (
+                stamp,
+                template.render_segments(
+                    {
+                        "color": item.message_level_color,
+                        "icon": item.icon,
+                        "label": label,
+                        "level": item.message_level.name.capitalize(),
+                        "message": item.message_with_count,
+                        "source": item.source,
+                    }
+                ),
+            )
+
+        self.fragments[key] = cached
+        return received.join(cached[1])
@@ -1,12 +1,26 @@
 """MessageLogSettings."""
 
+import asyncio
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
+from heapq import heapify, heappop, heappush
+from itertools import islice
+from pathlib import Path
+from sys import intern
+from time import time
+from types import SimpleNamespace
+from typing import Any, Self
+
+import jsonpickle
+import orjson
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util.uuid import random_uuid_hex
 
-from .const import STORAGE_KEY, STORAGE_VERSION
-from .hass_util import EnumExt, StorageJson
+from .const import LOGGER, STORAGE_KEY, STORAGE_KEY_VIEW, STORAGE_VERSION
+from .hass_util import EnumExt, StorageJournal, StorageJson
 
 
 # ------------------------------------------------------
@@ -56,9 +70,27 @@ class MessageListOrderBy(EnumExt):
 
 # ------------------------------------------------------
 # ------------------------------------------------------
-@dataclass
 class MessageItem:
-    """Message item."""
+    """Message item.
+
+    Slotted, with epoch timestamps and interned icon and source strings, to
+    keep large logs small. added_at and remove_after are still datetimes.
+    Repeats collapsed into the item are counted in count and last_seen.
+    """
+
+    __slots__ = (
+        "added_at_ts",
+        "count",
+        "dedup_key",
+        "icon",
+        "last_seen_ts",
+        "message",
+        "message_level",
+        "notify",
+        "remove_after_ts",
+        "source",
+        "uid",
+    )
 
     # ------------------------------------------------------------------
 
@@ -71,28 +103,82 @@ class MessageItem:
         notify: bool = False,
         added_at: datetime | None = None,
         source: str = "",
+        dedup_key: str = "",
     ) -> None:
         """Message data."""
         tmp_message_level: MessageLevel = MessageLevel.INFO
 
-        if isinstance(message_level, str):
+        if isinstance(message_level, MessageLevel):
+            tmp_message_level = message_level
+        elif isinstance(message_level, str):
             try:
                 tmp_message_level = MessageLevel[message_level.upper()]
             except KeyError:
                 tmp_message_level = MessageLevel.INFO
 
+        now: float = time()
+
         self.message: str = message
         self.message_level: MessageLevel = tmp_message_level
-        self.icon: str = icon
-        self.remove_after: datetime = datetime.now(UTC) + timedelta(hours=remove_after)
+        self.icon: str = intern(icon)
+        self.remove_after_ts: float = now + remove_after * 3600
         self.notify: bool = notify
+        self.added_at_ts: float = now if added_at is None else added_at.timestamp()
+        self.source: str = intern(source)
+        self.uid: str = random_uuid_hex()
+        self.count: int = 1
+        self.last_seen_ts: float = self.added_at_ts
+        self.dedup_key: str = dedup_key
 
-        if added_at is None:
-            self.added_at: datetime = datetime.now().astimezone(UTC)
-        else:
-            self.added_at: datetime = added_at
+    # ------------------------------------------------------
+    @property
+    def added_at(self) -> datetime:
+        """Added at."""
+        return datetime.fromtimestamp(self.added_at_ts, UTC)
 
-        self.source: str = source
+    # ------------------------------------------------------
+    @added_at.setter
+    def added_at(self, value: datetime) -> None:
+        """Added at."""
+        self.added_at_ts = value.timestamp()
+
+    # ------------------------------------------------------
+    @property
+    def remove_after(self) -> datetime:
+        """Remove after."""
+        return datetime.fromtimestamp(self.remove_after_ts, UTC)
+
+    # ------------------------------------------------------
+    @remove_after.setter
+    def remove_after(self, value: datetime) -> None:
+        """Remove after."""
+        self.remove_after_ts = value.timestamp()
+
+    # ------------------------------------------------------
+    @property
+    def last_seen(self) -> datetime:
+        """Last seen."""
+        return datetime.fromtimestamp(self.last_seen_ts, UTC)
+
+    # ------------------------------------------------------
+    @property
+    def message_with_count(self) -> str:
+        """Message with the repeat count."""
+
+        if self.count > 1:
+            return f"{self.message} ({self.count}x)"
+
+        return self.message
+
+    # ------------------------------------------------------
+    @property
+    def duplicate_key(self) -> tuple[str, int, str]:
+        """Key for collapsing repeats, the message unless a dedup key is given."""
+        return (
+            self.dedup_key or self.message,
+            self.message_level.value,
+            self.source,
+        )
 
     # ------------------------------------------------------
     @property
@@ -100,6 +186,56 @@ class MessageItem:
         """Message level color."""
         return self.message_level.color
 
+    # ------------------------------------------------------
+    def to_row(self) -> list:
+        """Encode to a compact storage row.
+
+        [message, level, icon, remove_after, notify, added_at, source, uid]
+        with the level as int and timestamps as epoch seconds. count,
+        last_seen and dedup_key are only appended for repeated or keyed items.
+        """
+        row: list = [
+            self.message,
+            self.message_level.value,
+            self.icon,
+            round(self.remove_after_ts),
+            1 if self.notify else 0,
+            round(self.added_at_ts, 3),
+            self.source,
+            self.uid,
+        ]
+
+        if self.count > 1 or self.dedup_key != "":
+            row.extend((self.count, round(self.last_seen_ts, 3), self.dedup_key))
+
+        return row
+
+    # ------------------------------------------------------
+    @classmethod
+    def from_row(cls, row: list) -> Self:
+        """Decode from a compact storage row, rows without counts are allowed."""
+        item: MessageItem = cls.__new__(cls)
+
+        item.message = row[0]
+        item.message_level = MessageLevel(row[1])
+        item.icon = intern(row[2])
+        item.remove_after_ts = float(row[3])
+        item.notify = bool(row[4])
+        item.added_at_ts = float(row[5])
+        item.source = intern(row[6])
+        item.uid = row[7]
+
+        if len(row) > 8:
+            item.count = row[8]
+            item.last_seen_ts = float(row[9])
+            item.dedup_key = row[10]
+        else:
+            item.count = 1
+            item.last_seen_ts = item.added_at_ts
+            item.dedup_key = ""
+
+        return item
+
 
 # ------------------------------------------------------
 # ------------------------------------------------------
@@ -117,6 +253,7 @@ class MessageItemAttr:
         notify: bool = False,
         added_at: datetime | None = None,
         source: str = "",
+        count: int = 1,
     ) -> None:
         """Message data."""
 
@@ -131,6 +268,7 @@ class MessageItemAttr:
             self.added_at: datetime = added_at.isoformat()
 
         self.source: str = source
+        self.count: int = count
 
     # ------------------------------------------------------
     @property
@@ -139,6 +277,392 @@ class MessageItemAttr:
         return self.message_level.color
 
 
+# ------------------------------------------------------
+# ------------------------------------------------------
+class MessageList:
+    """Message list with bounded retention.
+
+    Iterates newest first like the list it replaces. Items are also kept per
+    message level in insertion order, so evicting the oldest item of the
+    lowest level is O(1), and in a min-heap on remove_after, so finding the
+    expired items is O(expired * log n). Removed items are left in the heap
+    and skipped when popped. The newest item per duplicate key is indexed to
+    find repeats in O(1), the index is built on the first lookup so loading
+    does not pay for it when dedup is off.
+    """
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        items: Iterable[MessageItem] = (),
+        max_count: int = 0,
+        max_bytes: int = 0,
+    ) -> None:
+        """Init. Items are given newest first, a limit of 0 is unlimited."""
+
+        self.max_count: int = max_count
+        self.max_bytes: int = max_bytes
+        self.byte_size: int = 0
+        self.version: int = 0
+        self._attr: tuple[int, int, list[MessageItemAttr]] | None = None
+
+        self._items: dict[str, MessageItem] = {}
+        self._levels: dict[int, dict[str, MessageItem]] = {
+            message_level.value: {} for message_level in MessageLevel
+        }
+        self._sizes: dict[str, int] = {}
+        self._expiry: list[tuple[float, str]] = []
+        self._duplicates: dict[tuple[str, int, str], str] | None = None
+
+        for item in reversed(list(items)):
+            self.add(item)
+
+    # ------------------------------------------------------
+    def __len__(self) -> int:
+        """Len."""
+        return len(self._items)
+
+    # ------------------------------------------------------
+    def __iter__(self) -> Iterator[MessageItem]:
+        """Iterate newest first."""
+        return reversed(self._items.values())
+
+    # ------------------------------------------------------
+    def __getitem__(self, index: int) -> MessageItem:
+        """Get item by position, 0 is the newest."""
+
+        if index < 0:
+            index += len(self._items)
+
+        if index < 0 or index >= len(self._items):
+            raise IndexError("message list index out of range")
+
+        return next(islice(reversed(self._items.values()), index, None))
+
+    # ------------------------------------------------------
+    def __contains__(self, uid: object) -> bool:
+        """Contains uid."""
+        return uid in self._items
+
+    # ------------------------------------------------------
+    def get(self, uid: str) -> MessageItem | None:
+        """Get item by uid."""
+        return self._items.get(uid)
+
+    # ------------------------------------------------------
+    @property
+    def newest(self) -> MessageItem | None:
+        """Newest item."""
+
+        if len(self._items) == 0:
+            return None
+
+        return next(reversed(self._items.values()))
+
+    # ------------------------------------------------------
+    def top(
+        self,
+        count: int = 0,
+        order_by_level: bool = False,
+        message_level: MessageLevel | None = None,
+    ) -> list[MessageItem]:
+        """Newest items, highest level first when ordered by level.
+
+        Read from the per level views, so only the returned items are
+        visited. A count of 0 returns all, a message level only that level.
+        """
+
+        if count <= 0:
+            count = len(self._items)
+
+        if message_level is not None:
+            return list(
+                islice(reversed(self._levels[message_level.value].values()), count)
+            )
+
+        if not order_by_level:
+            return list(islice(reversed(self._items.values()), count))
+
+        items: list[MessageItem] = []
+
+        for level in reversed(MessageLevel):
+            items.extend(
+                islice(reversed(self._levels[level.value].values()), count - len(items))
+            )
+
+            if len(items) >= count:
+                break
+
+        return items
+
+    # ------------------------------------------------------
+    def to_attr(self, count: int) -> list[MessageItemAttr]:
+        """State attributes for the newest count items.
+
+        Cached until the list changes, the returned list must not be changed.
+        """
+
+        if self._attr is None or self._attr[:2] != (self.version, count):
+            self._attr = (
+                self.version,
+                count,
+                [
+                    MessageItemAttr(
+                        item.message,
+                        item.message_level,
+                        item.icon,
+                        item.notify,
+                        item.added_at,
+                        count=item.count,
+                    )
+                    for item in islice(reversed(self._items.values()), count)
+                ],
+            )
+
+        return self._attr[2]
+
+    # ------------------------------------------------------
+    @property
+    def highest_message_level(self) -> MessageLevel:
+        """Highest message level in the list."""
+
+        for message_level in reversed(MessageLevel):
+            if len(self._levels[message_level.value]) > 0:
+                return message_level
+
+        return MessageLevel.INFO
+
+    # ------------------------------------------------------
+    def add(self, item: MessageItem) -> None:
+        """Add item as the newest."""
+
+        if item.uid in self._items:
+            self.remove(item)
+
+        size: int = len(orjson.dumps(item.to_row()))
+
+        self._items[item.uid] = item
+        self._levels[item.message_level.value][item.uid] = item
+        self._sizes[item.uid] = size
+        self.byte_size += size
+        self.version += 1
+
+        if self._duplicates is not None:
+            self._duplicates[item.duplicate_key] = item.uid
+
+        self._push_expiry(item)
+
+    # ------------------------------------------------------
+    def remove(self, item: MessageItem) -> None:
+        """Remove item."""
+
+        if self._items.pop(item.uid, None) is None:
+            return
+
+        del self._levels[item.message_level.value][item.uid]
+        self.byte_size -= self._sizes.pop(item.uid)
+        self.version += 1
+
+        if (
+            self._duplicates is not None
+            and self._duplicates.get(item.duplicate_key) == item.uid
+        ):
+            del self._duplicates[item.duplicate_key]
+
+    # ------------------------------------------------------
+    def update(
+        self, item: MessageItem, old_key: tuple[str, int, str] | None = None
+    ) -> None:
+        """Replace the item with the same uid, keeping its position.
+
+        old_key is the duplicate key before the change, when item is the
+        listed item changed in place.
+        """
+
+        old_item: MessageItem | None = self._items.get(item.uid)
+
+        if old_item is None:
+            self.add(item)
+            return
+
+        if old_key is None:
+            old_key = old_item.duplicate_key
+
+        if self._duplicates is not None:
+            if self._duplicates.get(old_key) == item.uid:
+                del self._duplicates[old_key]
+
+            self._duplicates[item.duplicate_key] = item.uid
+
+        if old_item.message_level != item.message_level:
+            del self._levels[old_item.message_level.value][item.uid]
+
+        size: int = len(orjson.dumps(item.to_row()))
+
+        self._items[item.uid] = item
+        self._levels[item.message_level.value][item.uid] = item
+        self.version += 1
+        self.byte_size += size - self._sizes[item.uid]
+        self._sizes[item.uid] = size
+
+        self._push_expiry(item)
+
+    # ------------------------------------------------------
+    def find_duplicate(self, item: MessageItem, window: float) -> MessageItem | None:
+        """Find an item with the same duplicate key seen within window seconds."""
+
+        if self._duplicates is None:
+            self._duplicates = {
+                list_item.duplicate_key: list_item.uid
+                for list_item in self._items.values()
+            }
+
+        uid: str | None = self._duplicates.get(item.duplicate_key)
+
+        if uid is None:
+            return None
+
+        duplicate: MessageItem = self._items[uid]
+
+        if item.added_at_ts - duplicate.last_seen_ts > window:
+            return None
+
+        return duplicate
+
+    # ------------------------------------------------------
+    def repeat(self, duplicate: MessageItem, item: MessageItem) -> None:
+        """Collapse item into duplicate, counting it as a repeat."""
+
+        old_key: tuple[str, int, str] = duplicate.duplicate_key
+        duplicate.count += item.count
+        duplicate.message = item.message
+        duplicate.last_seen_ts = max(duplicate.last_seen_ts, item.added_at_ts)
+        duplicate.remove_after_ts = max(duplicate.remove_after_ts, item.remove_after_ts)
+
+        self.update(duplicate, old_key)
+
+    # ------------------------------------------------------
+    def remove_level(self, message_level: MessageLevel) -> list[MessageItem]:
+        """Remove all items with message level."""
+
+        removed_items: list[MessageItem] = list(
+            self._levels[message_level.value].values()
+        )
+
+        for item in removed_items:
+            self.remove(item)
+
+        return removed_items
+
+    # ------------------------------------------------------
+    def clear(self) -> list[MessageItem]:
+        """Remove all items."""
+
+        removed_items: list[MessageItem] = list(self)
+
+        self._items.clear()
+        self._sizes.clear()
+        self._expiry.clear()
+        self._duplicates = None
+        self.byte_size = 0
+        self.version += 1
+
+        for level_items in self._levels.values():
+            level_items.clear()
+
+        return removed_items
+
+    # ------------------------------------------------------
+    def _push_expiry(self, item: MessageItem) -> None:
+        """Push the expiry of item, rebuilding when mostly stale entries."""
+
+        heappush(self._expiry, (item.remove_after_ts, item.uid))
+
+        if len(self._expiry) > 2 * len(self._items) + 64:
+            self._expiry = [
+                (item.remove_after_ts, item.uid) for item in self._items.values()
+            ]
+            heapify(self._expiry)
+
+    # ------------------------------------------------------
+    def _drop_stale_expiry(self) -> None:
+        """Drop heap entries of items that are no longer in the list."""
+
+        while len(self._expiry) > 0 and (
+            (item := self._items.get(self._expiry[0][1])) is None
+            or item.remove_after_ts != self._expiry[0][0]
+        ):
+            heappop(self._expiry)
+
+    # ------------------------------------------------------
+    @property
+    def next_expiry(self) -> datetime | None:
+        """Earliest remove_after in the list."""
+
+        self._drop_stale_expiry()
+
+        if len(self._expiry) == 0:
+            return None
+
+        return datetime.fromtimestamp(self._expiry[0][0], UTC)
+
+    # ------------------------------------------------------
+    def remove_expired(self, now: datetime) -> list[MessageItem]:
+        """Remove items with remove_after at or before now."""
+
+        removed_items: list[MessageItem] = []
+        timestamp: float = now.timestamp()
+
+        self._drop_stale_expiry()
+
+        while len(self._expiry) > 0 and self._expiry[0][0] <= timestamp:
+            item: MessageItem = self._items[heappop(self._expiry)[1]]
+            self.remove(item)
+            removed_items.append(item)
+            self._drop_stale_expiry()
+
+        return removed_items
+
+    # ------------------------------------------------------
+    @property
+    def over_limit(self) -> bool:
+        """Count or byte limit exceeded."""
+        return (self.max_count > 0 and len(self._items) > self.max_count) or (
+            self.max_bytes > 0 and self.byte_size > self.max_bytes
+        )
+
+    # ------------------------------------------------------
+    @property
+    def full(self) -> bool:
+        """Count or byte limit reached."""
+        return (self.max_count > 0 and len(self._items) >= self.max_count) or (
+            self.max_bytes > 0 and self.byte_size >= self.max_bytes
+        )
+
+    # ------------------------------------------------------
+    def evict(self) -> MessageItem | None:
+        """Remove the oldest item of the lowest message level."""
+
+        for level_items in self._levels.values():
+            if len(level_items) > 0:
+                item: MessageItem = next(iter(level_items.values()))
+                self.remove(item)
+                return item
+
+        return None
+
+    # ------------------------------------------------------
+    def trim(self) -> list[MessageItem]:
+        """Evict items until within the limits."""
+
+        evicted_items: list[MessageItem] = []
+
+        while self.over_limit:
+            evicted_items.append(self.evict())
+
+        return evicted_items
+
+
 # ------------------------------------------------------
 # ------------------------------------------------------
 @dataclass
@@ -146,13 +670,41 @@ class MessageLogSettings(StorageJson):
     """MessageLogSettings."""
 
     # ------------------------------------------------------
-    def __init__(self, hass: HomeAssistant, orderby_message_level: bool = True) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        orderby_message_level: bool = True,
+        use_journal: bool = False,
+        write_delay: float = 0,
+        max_count: int = 0,
+        max_bytes: int = 0,
+    ) -> None:
         """Message log settings."""
 
-        super().__init__(hass, STORAGE_KEY, STORAGE_VERSION)
+        super().__init__(
+            hass,
+            STORAGE_KEY,
+            STORAGE_VERSION,
+            async_migrate_func=self.migrate_settings,
+            write_delay=write_delay,
+        )
+
+        self.DICT_KEY___ = STORAGE_KEY
+
+        self.use_journal___: bool = use_journal
+        self.journal___: StorageJournal = StorageJournal(hass, STORAGE_KEY)
+        self.journal_pending___: list[dict] = []
+        self.snapshot_pending___: bool = False
+        self.migrated___: bool = False
+        self.view_store___: Store = Store(hass, 1, STORAGE_KEY_VIEW)
+        self.view_missing___: bool = False
+        self.head_uid___: str = ""
+        self.loaded___: asyncio.Event = asyncio.Event()
 
         self.highest_message_level: MessageLevel = MessageLevel.INFO
-        self.message_list: list[MessageItem] = []
+        self.max_count___: int = max_count
+        self.max_bytes___: int = max_bytes
+        self.message_list: MessageList = self.create_message_list()
         self.message_list_show: MessageListShow = MessageListShow.ALL
         self.message_list_orderby: MessageListOrderBy = (
             MessageListOrderBy.MESSAGE_LEVEL
@@ -161,16 +713,381 @@ class MessageLogSettings(StorageJson):
         )
 
     # ------------------------------------------------------
-    def set_highest_message_level(self) -> None:
-        """Check for highest message level."""
-        self.highest_message_level = MessageLevel.INFO
+    def create_message_list(self, items: Iterable[MessageItem] = ()) -> MessageList:
+        """Create a message list with the retention limits."""
+        return MessageList(items, self.max_count___, self.max_bytes___)
+
+    # ------------------------------------------------------
+    def encode_data(self, data: Any) -> Any:
+        """Encode settings or a message item with the compact codec."""
+
+        if isinstance(data, MessageItem):
+            return data.to_row()
+
+        return {
+            "message_list": [item.to_row() for item in data.message_list],
+        }
+
+    # ------------------------------------------------------
+    def decode_data(self, data: Any) -> Any:
+        """Decode settings or a message item with the compact codec."""
+
+        if isinstance(data, list):
+            return MessageItem.from_row(data)
+
+        if isinstance(data, str):
+            return jsonpickle.decode(data)
+
+        message_list: MessageList = self.create_message_list(
+            MessageItem.from_row(row) for row in data.get("message_list", [])
+        )
+
+        return SimpleNamespace(
+            highest_message_level=message_list.highest_message_level,
+            message_list=message_list,
+            message_list_show=MessageListShow(
+                data.get("message_list_show", MessageListShow.ALL.value)
+            ),
+            message_list_orderby=MessageListOrderBy(
+                data.get("message_list_orderby", self.message_list_orderby.value)
+            ),
+        )
+
+    # ------------------------------------------------------
+    def migrate_settings(
+        self, old_major_version: int, old_minor_version: int, old_data: Any
+    ) -> Any:
+        """Migrate jsonpickle storage to the compact codec."""
+
+        if old_major_version == 1 and "jsonpickle" in old_data:
+            tmp_obj = jsonpickle.decode(old_data.pop("jsonpickle"))
+
+            for item in tmp_obj.message_list:
+                if getattr(item, "uid", "") == "":
+                    item.uid = random_uuid_hex()
+
+                if not hasattr(item, "count"):
+                    item.count = 1
+                    item.last_seen_ts = item.added_at_ts
+                    item.dedup_key = ""
+
+            old_data[STORAGE_KEY] = {
+                **self.encode_data(tmp_obj),
+                "message_list_show": tmp_obj.message_list_show.value,
+                "message_list_orderby": tmp_obj.message_list_orderby.value,
+            }
+            self.migrated___ = True
+
+        return old_data
+
+    # ------------------------------------------------------
+    @property
+    def loaded(self) -> bool:
+        """Full message list has been loaded."""
+        return self.loaded___.is_set()
+
+    # ------------------------------------------------------
+    async def async_wait_loaded(self) -> None:
+        """Wait for the full message list to be loaded."""
+        await self.loaded___.wait()
+
+    # ------------------------------------------------------
+    async def async_read_head(self) -> None:
+        """Read the view state with the newest message.
+
+        Lets the sensors show the newest message while async_read_settings
+        loads the full message list.
+        """
+
+        view: dict | None = await self.view_store___.async_load()
+
+        if view is None:
+            self.view_missing___ = True
+            return
+
+        self.message_list_show = MessageListShow(view["message_list_show"])
+        self.message_list_orderby = MessageListOrderBy(view["message_list_orderby"])
+        self.highest_message_level = MessageLevel(
+            view.get("highest_message_level", MessageLevel.INFO.value)
+        )
+
+        if view.get("head") is not None:
+            self.message_list = self.create_message_list(
+                [MessageItem.from_row(view["head"])]
+            )
+            self.head_uid___ = self.message_list[0].uid
+
+    # ------------------------------------------------------
+    async def async_read_settings(self) -> list[MessageItem]:
+        """Read snapshot and replay the journal.
+
+        Messages added while loading are kept in front of the loaded ones.
+        Returns the messages evicted to get within the limits.
+        """
+
+        records: list[dict] = []
+        head_list: MessageList = self.message_list
+        message_list_show: MessageListShow = self.message_list_show
+        message_list_orderby: MessageListOrderBy = self.message_list_orderby
+
+        try:
+            message_list, records = await self.hass___.async_add_executor_job(self.load)
+
+            if message_list is None:
+                # Missing or older storage version, let Store load and migrate it
+                self.message_list = self.create_message_list()
+                await super().async_read_settings()
 
-        for item in self.message_list:
-            if item.message_level > self.highest_message_level:
-                self.highest_message_level = item.message_level
+                if not self.view_missing___:
+                    self.message_list_show = message_list_show
+                    self.message_list_orderby = message_list_orderby
+            else:
+                self.message_list = message_list
 
-                if self.highest_message_level == MessageLevel.ERROR:
-                    break
+            self.journal___.record_count = len(records)
+
+            if len(records) > 0:
+                self.replay_journal(records)
+
+            for item in reversed(list(head_list)):
+                if item.uid not in self.message_list:
+                    self.message_list.add(item)
+        except Exception:  # noqa: BLE001
+            self.message_list = head_list
+            self.message_list_show = message_list_show
+            self.message_list_orderby = message_list_orderby
+            self.journal___.record_count = 0
+            self.migrated___ = False
+            records = []
+
+            # Move the storage aside before anything is written over it
+            corrupt_path: str = await self.hass___.async_add_executor_job(
+                self.save_corrupt
+            )
+            LOGGER.exception(
+                "Could not load the message log, it has been saved as %s and a new"
+                " one is started with the newest message",
+                corrupt_path,
+            )
+            self.snapshot_pending___ = True
+            self.write_pending___ = True
+        finally:
+            # Never leave writes held back and waiters blocked
+            self.loaded___.set()
+
+        evicted_items: list[MessageItem] = self.message_list.trim()
+        self.set_highest_message_level()
+
+        if len(evicted_items) > 0:
+            self.snapshot_pending___ = True
+            self.write_pending___ = True
+
+        if self.view_missing___:
+            self.view_missing___ = False
+            await self.async_write_view()
+
+        if self.migrated___ or (len(records) > 0 and not self.use_journal___):
+            self.migrated___ = False
+            await self.async_write_settings()
+        elif self.write_pending___:
+            await self.async_flush_settings()
+
+        return evicted_items
+
+    # ------------------------------------------------------
+    def load(self) -> tuple[MessageList | None, list[dict]]:
+        """Load and decode the message list and the journal.
+
+        Runs as one executor job. The message list is None when there is no
+        storage file or it has an older version, then Store must handle it.
+        """
+
+        message_list: MessageList | None = None
+        path: Path = Path(self.hass___.config.path(STORAGE_DIR, STORAGE_KEY))
+
+        if path.is_file():
+            stored: dict = orjson.loads(path.read_bytes())
+
+            if stored.get("version") == STORAGE_VERSION:
+                message_list = self.create_message_list(
+                    MessageItem.from_row(row)
+                    for row in stored["data"]
+                    .get(STORAGE_KEY, {})
+                    .get("message_list", [])
+                )
+
+        return message_list, self.journal___.load()
+
+    # ------------------------------------------------------
+    def save_corrupt(self) -> str:
+        """Move the unreadable storage file and journal aside, like Store does."""
+
+        path: Path = Path(self.hass___.config.path(STORAGE_DIR, STORAGE_KEY))
+        suffix: str = ".corrupt." + datetime.now(UTC).isoformat()
+        corrupt_path: Path = path.with_name(path.name + suffix)
+
+        if path.is_file():
+            path.rename(corrupt_path)
+
+        if self.journal___.path.is_file():
+            self.journal___.path.rename(
+                self.journal___.path.with_name(self.journal___.path.name + suffix)
+            )
+
+        return str(corrupt_path)
+
+    # ------------------------------------------------------
+    def replay_journal(self, records: list[dict]) -> None:
+        """Replay journal records.
+
+        Replay is idempotent, an add already in the snapshot is skipped and a
+        remove of an unknown item is ignored.
+        """
+
+        for record in records:
+            match record.get("op"):
+                case "add":
+                    item: MessageItem = self.decode_data(record["item"])
+
+                    if item.uid not in self.message_list:
+                        self.message_list.add(item)
+                case "update":
+                    self.message_list.update(self.decode_data(record["item"]))
+                case "remove":
+                    for uid in record["uids"]:
+                        if (item := self.message_list.get(uid)) is not None:
+                            self.message_list.remove(item)
+
+        self.set_highest_message_level()
+
+    # ------------------------------------------------------
+    async def async_write_settings(self, extra_data: dict = {}) -> None:
+        """Write snapshot and truncate the journal."""
+
+        self.snapshot_pending___ = False
+        self.journal_pending___ = []
+
+        await super().async_write_settings(extra_data)
+        await self.journal___.async_truncate()
+
+    # ------------------------------------------------------
+    async def async_write_view(self) -> None:
+        """Write the view state only, the message list is left untouched.
+
+        The newest message is included so it can be shown at startup.
+        """
+
+        self.head_uid___ = (
+            self.message_list[0].uid if len(self.message_list) > 0 else ""
+        )
+
+        await self.view_store___.async_save(
+            {
+                "message_list_show": self.message_list_show.value,
+                "message_list_orderby": self.message_list_orderby.value,
+                "highest_message_level": self.highest_message_level.value,
+                "head": (
+                    self.message_list[0].to_row()
+                    if len(self.message_list) > 0
+                    else None
+                ),
+            }
+        )
+
+    # ------------------------------------------------------
+    def set_added_pending(self, items: list[MessageItem]) -> None:
+        """Mark added messages as pending a write."""
+
+        if self.use_journal___:
+            self.journal_pending___.extend(
+                {"op": "add", "item": self.encode_data(item)} for item in items
+            )
+        else:
+            self.snapshot_pending___ = True
+
+    # ------------------------------------------------------
+    def set_updated_pending(self, items: list[MessageItem]) -> None:
+        """Mark messages updated in place as pending a write."""
+
+        if self.use_journal___:
+            self.journal_pending___.extend(
+                {"op": "update", "item": self.encode_data(item)} for item in items
+            )
+        else:
+            self.snapshot_pending___ = True
+
+        if any(item.uid == self.head_uid___ for item in items):
+            # Rewrite the view, its copy of the newest message is outdated
+            self.head_uid___ = ""
+
+    # ------------------------------------------------------
+    def set_removed_pending(self, items: list[MessageItem]) -> None:
+        """Mark removed messages as pending a write."""
+
+        if len(items) == 0:
+            return
+
+        if self.use_journal___:
+            self.journal_pending___.append(
+                {"op": "remove", "uids": [item.uid for item in items]}
+            )
+        else:
+            self.snapshot_pending___ = True
+
+    # ------------------------------------------------------
+    async def async_write_removed(self, items: list[MessageItem]) -> None:
+        """Persist removed messages."""
+
+        if len(items) == 0:
+            return
+
+        self.set_removed_pending(items)
+        await self.async_write_settings_delayed()
+
+    # ------------------------------------------------------
+    async def async_write_pending(self) -> None:
+        """Write pending snapshot or append pending journal records.
+
+        Held back until the full message list has been loaded.
+        """
+
+        if not self.loaded:
+            self.write_pending___ = True
+            return
+
+        if self.snapshot_pending___:
+            await self.async_write_settings()
+        else:
+            records: list[dict] = self.journal_pending___
+            self.journal_pending___ = []
+
+            await self.journal___.async_append(records)
+            await self.async_compact_journal()
+
+        if self.head_uid___ != (
+            self.message_list[0].uid if len(self.message_list) > 0 else ""
+        ):
+            await self.async_write_view()
+
+    # ------------------------------------------------------
+    async def async_compact_journal(self) -> None:
+        """Compact the journal into a snapshot when it has grown large."""
+
+        if self.journal___.compact_needed:
+            await self.async_write_settings()
+
+    # ------------------------------------------------------
+    async def async_remove_settings(self) -> None:
+        """Remove settings and journal."""
+
+        await super().async_remove_settings()
+        await self.journal___.async_truncate()
+        await self.view_store___.async_remove()
+
+    # ------------------------------------------------------
+    def set_highest_message_level(self) -> None:
+        """Check for highest message level."""
+        self.highest_message_level = self.message_list.highest_message_level
 
     # ------------------------------------------------------
     @property
@@ -0,0 +1,143 @@
+"""Rate limits."""
+
+from heapq import nlargest
+from time import monotonic
+
+from .message_log_settings import MessageItem
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class TokenBucket:
+    """Token bucket refilled with rate tokens per second up to capacity."""
+
+    __slots__ = ("capacity", "rate", "tokens", "updated_at")
+
+    def __init__(self, capacity: float, rate: float, now: float) -> None:
+        """Init, the bucket starts full."""
+
+        self.capacity: float = capacity
+        self.rate: float = rate
+        self.tokens: float = capacity
+        self.updated_at: float = now
+
+    # ------------------------------------------------------------------
+    def refill(self, now: float) -> None:
+        """Refill for the time passed since the last refill."""
+
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    # ------------------------------------------------------------------
+    @property
+    def full(self) -> bool:
+        """Bucket is full."""
+        return self.tokens >= self.capacity
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class RateLimiter:
+    """Limits of messages per minute per source and in total, 0 is no limit.
+
+    A bucket holds one minute of messages, so a burst up to the limit is let
+    through at once. Limited messages are counted per source, for the most
+    limited MAX_LIMITED_SOURCES sources.
+    """
+
+    MAX_BUCKETS: int = 1024
+    MAX_LIMITED_SOURCES: int = 100
+
+    def __init__(self, per_source: float = 0, total: float = 0) -> None:
+        """Init."""
+
+        self.per_source: float = per_source
+        self.total: float = total
+        self.buckets: dict[str, TokenBucket] = {}
+        self.total_bucket: TokenBucket = TokenBucket(total, total / 60, monotonic())
+        self.limited: dict[str, int] = {}
+        self.limited_count: int = 0
+
+    # ------------------------------------------------------------------
+    @property
+    def enabled(self) -> bool:
+        """A limit is set."""
+        return self.per_source > 0 or self.total > 0
+
+    # ------------------------------------------------------------------
+    def allow(self, message_item: MessageItem, now: float | None = None) -> bool:
+        """Take a token for the message, counting it as limited when none left."""
+
+        if now is None:
+            now = monotonic()
+
+        bucket: TokenBucket | None = None
+
+        if self.per_source > 0:
+            if (bucket := self.buckets.get(message_item.source)) is None:
+                if len(self.buckets) >= self.MAX_BUCKETS:
+                    self.prune(now)
+
+                bucket = self.buckets[message_item.source] = TokenBucket(
+                    self.per_source, self.per_source / 60, now
+                )
+
+            bucket.refill(now)
+
+        if self.total > 0:
+            self.total_bucket.refill(now)
+
+        if (bucket is not None and bucket.tokens < 1) or (
+            self.total > 0 and self.total_bucket.tokens < 1
+        ):
+            if (
+                message_item.source not in self.limited
+                and len(self.limited) >= self.MAX_LIMITED_SOURCES
+            ):
+                self.limited = self.top_limited(self.MAX_LIMITED_SOURCES // 2)
+
+            self.limited[message_item.source] = (
+                self.limited.get(message_item.source, 0) + 1
+            )
+            self.limited_count += 1
+            return False
+
+        if bucket is not None:
+            bucket.tokens -= 1
+
+        if self.total > 0:
+            self.total_bucket.tokens -= 1
+
+        return True
+
+    # ------------------------------------------------------------------
+    def filter(self, message_items: list[MessageItem]) -> list[MessageItem]:
+        """Messages within the limits."""
+
+        if not self.enabled:
+            return message_items
+
+        now: float = monotonic()
+        return [
+            message_item
+            for message_item in message_items
+            if self.allow(message_item, now)
+        ]
+
+    # ------------------------------------------------------------------
+    def top_limited(self, count: int) -> dict[str, int]:
+        """Most limited sources with their limited counts."""
+
+        return dict(nlargest(count, self.limited.items(), key=lambda item: item[1]))
+
+    # ------------------------------------------------------------------
+    def prune(self, now: float) -> None:
+        """Remove buckets that have refilled, a new bucket starts full anyway."""
+
+        for source, bucket in list(self.buckets.items()):
+            bucket.refill(now)
+
+            if bucket.full:
+                del self.buckets[source]
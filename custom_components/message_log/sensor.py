@@ -23,7 +23,8 @@ from .const import (
 )
 from .entity import ComponentEntity
 from .hass_util import TimerTrigger, TimerTriggerErrorEnum
-from .message_log_settings import MessageItemAttr
+
+RATE_LIMITED_SOURCES_COUNT = 10
 
 
 # ------------------------------------------------------
@@ -34,8 +35,6 @@ async def async_setup_entry(
 ) -> None:
     """Sensor setup."""
 
-    await entry.runtime_data.component_api.settings.async_read_settings()
-
     sensors = []
 
     sensors.append(MessageLastSensor(hass, entry))
@@ -49,6 +48,18 @@ async def async_setup_entry(
 class MessageLastSensor(ComponentEntity, SensorEntity):
     """Sensor class for Last Message."""
 
+    # Rewritten on every scroll tick or diagnostic only, keep them out of the
+    # recorder database
+    _unrecorded_attributes = frozenset(
+        {
+            "markdown",
+            "markdown_message_list",
+            "markdown_settings",
+            "message_list",
+            "rate_limited_sources",
+        }
+    )
+
     # ------------------------------------------------------
     def __init__(
         self,
@@ -106,6 +117,20 @@ class MessageLastSensor(ComponentEntity, SensorEntity):
                 0
             ].added_at.isoformat()
 
+            if self.component_api.settings.message_list[0].count > 1:
+                attr["last_message_count"] = self.component_api.settings.message_list[
+                    0
+                ].count
+
+        if self.component_api.rate_limiter.limited_count > 0:
+            attr["rate_limited_count"] = self.component_api.rate_limiter.limited_count
+            attr["rate_limited_sources"] = self.component_api.rate_limiter.top_limited(
+                RATE_LIMITED_SOURCES_COUNT
+            )
+
+        if self.component_api.overflow_dropped_count > 0:
+            attr["overflow_dropped_count"] = self.component_api.overflow_dropped_count
+
         if self.component_api.highest_message_level:
             attr["highest_message_level"] = self.component_api.highest_message_level
 
@@ -118,19 +143,9 @@ class MessageLastSensor(ComponentEntity, SensorEntity):
         if self.component_api.markdown_message_settings:
             attr["markdown_settings"] = self.component_api.markdown_message_settings
 
-        message_list_attr: list[MessageItemAttr] = [
-            MessageItemAttr(
-                item.message,
-                item.message_level,
-                item.icon,
-                item.notify,
-                item.added_at,
-            )
-            for item in self.component_api.settings.message_list
-        ]
-        attr["message_list"] = message_list_attr[
-            : int(self.entry.options.get(CONF_MARKDOWN_MESSAGE_LIST_COUNT, 10))
-        ]
+        attr["message_list"] = self.component_api.settings.message_list.to_attr(
+            int(self.entry.options.get(CONF_MARKDOWN_MESSAGE_LIST_COUNT, 10))
+        )
 
         return attr
 
@@ -184,6 +199,7 @@ class MessageLastSensor(ComponentEntity, SensorEntity):
 
         if event.data["action"] == "remove":
             await self.component_api.settings.async_remove_settings()
+            await self.component_api.archive.async_remove()
 
 
 # ------------------------------------------------------
@@ -249,7 +265,7 @@ class MessageScrollSensor(ComponentEntity, SensorEntity):
                     pass
             return
 
-        await self.coordinator.async_refresh()
+        await self.component_api.async_scroll()
 
     # ------------------------------------------------------
     @property